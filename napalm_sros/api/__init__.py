@@ -18,4 +18,5 @@
 
 from .get_bgp_neighbors import get_bgp_neighbors # noqa
 from .get_bgp_neighbors_detail import get_bgp_neighbors_detail # noqa
+from .get_bgp_neighbors_detail import GET_BGP_NEIGHBORS_ALL # noqa
 
@@ -20,10 +20,10 @@
 
 import logging, datetime
 
-from ncclient.xml_ import to_xml, to_ele
-from napalm.base.helpers import convert
+from lxml import etree
+from ncclient.xml_ import to_xml
 
-from .util import _find_txt, NSMAP
+from .util import _find_txt, _to_int, NSMAP
 
 #
 # Netconf filters to retrieve only required attributes
@@ -36,9 +36,6 @@ NEIGHBOR_CONF = """
         <admin-state/>
         <description/>
         <peer-as/>
-        <local-as>
-            <as-number/>
-        </local-as>
     </neighbor>
 </bgp>
 """
@@ -101,69 +98,133 @@ GET_BGP_NEIGHBORS = """
 
 log = logging.getLogger(__file__)
 
-def get_bgp_neighbors(conn):
-  data = to_ele(
-      conn.get(
-          filter=GET_BGP_NEIGHBORS,
-          with_defaults="report-all",
-      ).data_xml
+#
+# Compiled XPath expressions, shared by all calls
+#
+_XP_SERVICE_NAME = etree.XPath("state_ns:service-name", namespaces=NSMAP)
+_XP_OPER_ROUTER_ID = etree.XPath("state_ns:oper-router-id", namespaces=NSMAP)
+_XP_CONF_SERVICE_NAME = etree.XPath("../../configure_ns:service-name", namespaces=NSMAP)
+_XP_CONF_AS = etree.XPath("../../configure_ns:autonomous-system", namespaces=NSMAP)
+_XP_IP_ADDRESS = etree.XPath("state_ns:ip-address", namespaces=NSMAP)
+_XP_CONF = {
+  attr: etree.XPath(f"configure_ns:{attr}", namespaces=NSMAP)
+  for attr in ('ip-address','admin-state','description','peer-as')
+}
+_XP_STATE = {
+  attr: etree.XPath(f"state_ns:statistics/state_ns:{attr}", namespaces=NSMAP)
+  for attr in ('peer-identifier','session-state','last-established-time')
+}
+_XP_PREFIX_COUNT = {
+  (attr, af): etree.XPath(
+    f"state_ns:statistics/state_ns:family-prefix/state_ns:{af}/state_ns:{attr}",
+    namespaces=NSMAP
   )
+  for attr in ('received','active','sent') for af in ('ipv4','ipv6')
+}
+
+#
+# Elements collected in a single walk over the reply
+#
+_STATE = "{" + NSMAP["state_ns"] + "}"
+_CONF = "{" + NSMAP["configure_ns"] + "}"
+_TAG_CURRENT_TIME = _STATE + "current-time"
+_TAG_OPER_ROUTER_ID = _STATE + "oper-router-id"
+_TAG_ROUTER = _STATE + "router"
+_TAG_VPRN = _STATE + "vprn"
+_TAG_STATE_NEIGHBOR = _STATE + "neighbor"
+_TAG_CONF_NEIGHBOR = _CONF + "neighbor"
+_WALK_TAGS = (
+  _TAG_CURRENT_TIME, _TAG_OPER_ROUTER_ID, _TAG_VPRN, _TAG_STATE_NEIGHBOR, _TAG_CONF_NEIGHBOR
+)
+
+def _to_timestamp(time:str):
+  """
+  Converts an SR OS time like '2022-10-12T01:07:50.6Z' to a POSIX timestamp.
+  The layout is fixed, so the fields are sliced out instead of going through strptime.
+  """
+  if time:
+    # Remove 'Z' timezone, the fraction has a variable number of digits
+    fraction = time[20:-1] if time[19:20] == "." else ""
+    return datetime.datetime(
+      int(time[0:4]), int(time[5:7]), int(time[8:10]),
+      int(time[11:13]), int(time[14:16]), int(time[17:19]),
+      int(fraction[:6].ljust(6, "0")),
+    ).timestamp()
+  return 0
+
+def get_bgp_neighbors(conn,data=None):
+  """
+  data: an already retrieved reply covering GET_BGP_NEIGHBORS, e.g. for GET_BGP_NEIGHBORS_ALL
+  """
+  if data is None:
+    data = conn.get(
+        filter=GET_BGP_NEIGHBORS,
+        with_defaults="report-all",
+    ).data_ele
   if log.isEnabledFor(logging.DEBUG):
     log.debug(to_xml(data, pretty_print=True))
 
-  current_time_str = _find_txt(data,'//state_ns:system/state_ns:current-time')
+  # One pass over the reply, instead of a '//' search for each kind of element
+  current_time_str = global_router_id = ""
+  vprns, state_neighbors, conf_neighbors = [], [], []
+  for _, ele in etree.iterwalk(data, events=("start",), tag=_WALK_TAGS):
+    tag = ele.tag
+    if tag == _TAG_CONF_NEIGHBOR:
+      conf_neighbors.append(ele)
+    elif tag == _TAG_STATE_NEIGHBOR:
+      state_neighbors.append(ele)
+    elif tag == _TAG_VPRN:
+      vprns.append(ele)
+    elif tag == _TAG_CURRENT_TIME:
+      current_time_str = current_time_str or (ele.text or "").strip()
+    elif not global_router_id and ele.getparent().tag == _TAG_ROUTER:
+      global_router_id = (ele.text or "").strip()
+
+  current_time = _to_timestamp(current_time_str)
 
   # List all VRFs and the operational local router ID
   result = {
     'global': {
-      'router_id': _find_txt(data,"//state_ns:router/state_ns:oper-router-id"),
+      'router_id': global_router_id,
       'peers': {}
     }
   }
-  for vprn in data.xpath("//state_ns:service/state_ns:vprn",namespaces=NSMAP):
-    name = _find_txt(vprn, "state_ns:service-name")
-    router_id = _find_txt(vprn, "state_ns:oper-router-id")
+  for vprn in vprns:
+    name = _find_txt(vprn, _XP_SERVICE_NAME)
+    router_id = _find_txt(vprn, _XP_OPER_ROUTER_ID)
     result[ name ] = { 'router_id': router_id, 'peers': {} }
 
-  for n in data.xpath("//configure_ns:neighbor",namespaces=NSMAP):
-    name = _find_txt(n, "../../configure_ns:service-name") or "global"
-    local_as = convert(int, _find_txt( n, "../../configure_ns:autonomous-system" ))
+  # Operational state of each peer by address, the first one listed wins
+  stats_by_ip = {}
+  for stats in state_neighbors:
+    stats_by_ip.setdefault(_find_txt(stats, _XP_IP_ADDRESS), stats)
+
+  for n in conf_neighbors:
+    name = _find_txt(n, _XP_CONF_SERVICE_NAME) or "global"
+    local_as = _to_int(_find_txt( n, _XP_CONF_AS ))
 
-    ip_address = _find_txt( n, "configure_ns:ip-address" )
-    stats = data.xpath( f"//state_ns:ip-address[ text()='{ip_address}']/..", namespaces=NSMAP)
+    ip_address = _find_txt( n, _XP_CONF['ip-address'] )
+    stats = stats_by_ip[ip_address]
 
     def conf_int(attr: str,default=0):
-      return convert( int, _find_txt(n,f"configure_ns:{attr}")) or default
+      return _to_int(_find_txt(n,_XP_CONF[attr])) or default
 
     def conf_str(attr: str):
-      return _find_txt(n,f"configure_ns:{attr}")
+      return _find_txt(n,_XP_CONF[attr])
 
     def state_str(attr: str):
-      return _find_txt(stats[0],f"state_ns:statistics/state_ns:{attr}")
-
-    def to_timestamp(time:str):
-      if time:
-        # Remove 'Z' timezone
-        return datetime.datetime.strptime(time[:-1], "%Y-%m-%dT%H:%M:%S.%f").timestamp()
-      return 0
+      return _find_txt(stats,_XP_STATE[attr])
 
     session_state = state_str('session-state')
-    router_id = _find_txt( data, f"//state_ns:ip-address[text()='{ip_address}']/../../../state_ns:oper-router-id" )
 
     count = {}
     for attr in ['received','active','sent']:
       count[attr] = {}
       for af in ('ipv4','ipv6'):
-        count[attr][af] = convert(
-            int,
-            _find_txt(
-                stats[0],
-                f"state_ns:statistics/state_ns:family-prefix/state_ns:{af}/state_ns:{attr}"
-            )
-        )
+        count[attr][af] = _to_int(_find_txt(stats, _XP_PREFIX_COUNT[attr, af]))
 
-    last_established_time = to_timestamp(state_str('last-established-time'))
-    uptime = to_timestamp(current_time_str) - last_established_time
+    last_established_time = _to_timestamp(state_str('last-established-time'))
+    uptime = current_time - last_established_time
 
     peer = {
       'local_as': local_as,
@@ -172,7 +233,7 @@ def get_bgp_neighbors(conn):
       'is_up': session_state.lower()=="established",
       'is_enabled': conf_str('admin-state') == "enable",
       'description': conf_str('description'),
-      'uptime': convert(int,uptime), # Current or time since down if is_up=False
+      'uptime': _to_int(uptime), # Current or time since down if is_up=False
       'address_family': {
         'ipv4': {
          'received_prefixes': count['received']['ipv4'],
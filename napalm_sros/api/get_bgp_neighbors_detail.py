@@ -20,9 +20,10 @@
 
 import logging
 
-from ncclient.xml_ import to_xml, to_ele
-from napalm.base.helpers import convert
-from .util import _find_txt, NSMAP
+from lxml import etree
+from ncclient.xml_ import to_xml
+from .get_bgp_neighbors import GET_BGP_NEIGHBORS
+from .util import _find_txt, _to_int, _leaf_texts, _merge_filters, NSMAP
 
 #
 # Netconf filters to retrieve only required attributes
@@ -38,7 +39,6 @@ NEIGHBOR_CONF = """
     <asn-4-byte/>
     <keepalive/>
     <local-as>
-        <as-number/>
         <prepend-global-as/>
     </local-as>
     <remove-private>
@@ -52,7 +52,6 @@ NEIGHBOR_CONF = """
     </export>
     <hold-time>
         <seconds/>
-        <minimum-hold-time/>
     </hold-time>
 </neighbor>
 """
@@ -67,7 +66,6 @@ NEIGHBOR_STATS = """
     <peer-identifier/>
     <peer-port/>
     <operational-local-address/>
-    <operational-remote-address/>
     <last-state/>
     <last-event/>
     <keep-alive-interval/>
@@ -136,45 +134,87 @@ GET_BGP_NEIGHBORS_DETAILS = """
     </filter>
 """
 
+#
+# Union of the get_bgp_neighbors and get_bgp_neighbors_detail filters for all
+# neighbors, lets both getters parse one shared reply
+#
+GET_BGP_NEIGHBORS_ALL = _merge_filters(
+  GET_BGP_NEIGHBORS, GET_BGP_NEIGHBORS_DETAILS.format(neighbor_address="")
+)
+
 log = logging.getLogger(__file__)
 
-def get_bgp_neighbors_detail(conn,neighbor_address=""):
-  data = to_ele(
-      conn.get(
-          filter=GET_BGP_NEIGHBORS_DETAILS.format(
-              neighbor_address=neighbor_address
-          ),
-          with_defaults="report-all",
-      ).data_xml
+#
+# Compiled XPath expressions, shared by all calls
+#
+_XP_CONF_NEIGHBORS = etree.XPath("//configure_ns:neighbor", namespaces=NSMAP)
+_XP_CONF_NEIGHBORS_BY_IP = etree.XPath(
+  "//configure_ns:neighbor[configure_ns:ip-address=$ip]", namespaces=NSMAP
+)
+_XP_CONF_SERVICE_NAME = etree.XPath("../../configure_ns:service-name", namespaces=NSMAP)
+_XP_CONF_AS = etree.XPath("../../configure_ns:autonomous-system", namespaces=NSMAP)
+_XP_STATE_NEIGHBORS = etree.XPath("//state_ns:bgp/state_ns:neighbor", namespaces=NSMAP)
+_XP_IP_ADDRESS = etree.XPath("state_ns:ip-address", namespaces=NSMAP)
+_XP_CONF = {
+  attr: etree.XPath(f"configure_ns:{attr}", namespaces=NSMAP)
+  for attr in (
+    'ip-address','peer-as','local-address','multihop','multipath-eligible','asn-4-byte',
+    'keepalive','hold-time/configure_ns:seconds','remove-private/configure_ns:limited',
+    'local-as/configure_ns:prepend-global-as','import/configure_ns:policy',
+    'export/configure_ns:policy',
   )
+}
+_XP_STATISTICS = etree.XPath("state_ns:statistics", namespaces=NSMAP)
+
+def get_bgp_neighbors_detail(conn,neighbor_address="",data=None):
+  """
+  data: an already retrieved reply for GET_BGP_NEIGHBORS_ALL, neighbor_address then selects
+        the peer from it
+  """
+  if data is None:
+    data = conn.get(
+        filter=GET_BGP_NEIGHBORS_DETAILS.format(neighbor_address=neighbor_address),
+        with_defaults="report-all",
+    ).data_ele
   if log.isEnabledFor(logging.DEBUG):
     log.debug(to_xml(data, pretty_print=True))
   result = {}
-  for n in data.xpath("//configure_ns:neighbor",namespaces=NSMAP):
-    name = _find_txt(n, "../../configure_ns:service-name") or "global"
-    local_as = convert(int, _find_txt( n, "../../configure_ns:autonomous-system" ))
+  # Operational state of each peer by address, the first one listed wins
+  stats_by_ip = {}
+  for stats in _XP_STATE_NEIGHBORS(data):
+    stats_by_ip.setdefault(_find_txt(stats, _XP_IP_ADDRESS), stats)
+
+  if neighbor_address:
+    neighbors = _XP_CONF_NEIGHBORS_BY_IP(data, ip=neighbor_address)
+  else:
+    neighbors = _XP_CONF_NEIGHBORS(data)
+  for n in neighbors:
+    name = _find_txt(n, _XP_CONF_SERVICE_NAME) or "global"
+    local_as = _to_int(_find_txt( n, _XP_CONF_AS ))
 
-    ip_address = _find_txt( n, "configure_ns:ip-address" )
-    stats = data.xpath( f"//state_ns:ip-address[ text()='{ip_address}']/..", namespaces=NSMAP)
+    ip_address = _find_txt( n, _XP_CONF['ip-address'] )
+    stats = stats_by_ip[ip_address]
+    # all statistics leaves of the peer in one walk, keyed like 'received/messages'
+    statistics = _XP_STATISTICS(stats)
+    state = _leaf_texts(statistics[0]) if statistics else {}
 
     def conf_int(attr: str,default=0):
-      return convert( int, _find_txt(n,f"configure_ns:{attr}")) or default
+      return _to_int(_find_txt(n,_XP_CONF[attr])) or default
 
     def state_int(attr: str):
-      return convert( int, _find_txt(stats[0],f"state_ns:statistics/state_ns:{attr}"))
+      return _to_int(state.get(attr, ""))
 
     def conf_str(attr: str):
-      return _find_txt(n,f"configure_ns:{attr}")
+      return _find_txt(n,_XP_CONF[attr])
 
     def conf_bool(attr:str):
       return conf_str(attr).lower() == "true"
 
     def conf_list(attr:str):
-      policies = [ele.text for ele in n.xpath(attr,namespaces=NSMAP)]
-      return ",".join(policies)
+      return ",".join(ele.text for ele in _XP_CONF[attr](n) if ele.text)
 
     def state_str(attr: str):
-      return _find_txt(stats[0],f"state_ns:statistics/state_ns:{attr}")
+      return state.get(attr, "")
 
     session_state = state_str('session-state')
 
@@ -182,13 +222,7 @@ def get_bgp_neighbors_detail(conn,neighbor_address=""):
     for attr in ['active','suppressed','rejected','sent','received']:
       count[attr] = {}
       for af in ('ipv4','ipv6'):
-        count[attr][af] = convert(
-            int,
-            _find_txt(
-                stats[0],
-                f"state_ns:statistics/state_ns:family-prefix/state_ns:{af}/state_ns:{attr}"
-            )
-        )
+        count[attr][af] = _to_int(state.get(f"family-prefix/{af}/{attr}", ""))
       count[attr]['total'] = count[attr]['ipv4'] + count[attr]['ipv6']
 
     peer = {
@@ -207,11 +241,11 @@ def get_bgp_neighbors_detail(conn,neighbor_address=""):
       'remove_private_as': conf_bool('remove-private/configure_ns:limited'),
       'import_policy': conf_list('import/configure_ns:policy'),
       'export_policy': conf_list('export/configure_ns:policy'),
-      'input_messages': state_int('received/state_ns:messages'),
-      'output_messages': state_int('sent/state_ns:messages'),
-      'input_updates': state_int('received/state_ns:updates'),
-      'output_updates': state_int('sent/state_ns:updates'),
-      'messages_queued_out': state_int('sent/state_ns:queues'),
+      'input_messages': state_int('received/messages'),
+      'output_messages': state_int('sent/messages'),
+      'input_updates': state_int('received/updates'),
+      'output_updates': state_int('sent/updates'),
+      'messages_queued_out': state_int('sent/queues'),
       'connection_state': session_state,
       'previous_connection_state': state_str('last-state'),
       'last_event': state_str('last-event'),
@@ -229,10 +263,6 @@ def get_bgp_neighbors_detail(conn,neighbor_address=""):
       'flap_count': state_int('number-of-update-flaps')
     }
 
-    if name not in result:
-      result[name] = {}
-    if peer['remote_as'] not in result[name]:
-      result[name][ peer['remote_as'] ] = []
-    result[name][ peer['remote_as'] ].append(peer)
+    result.setdefault(name, {}).setdefault(peer['remote_as'], []).append(peer)
 
   return result
@@ -16,13 +16,21 @@
 # License for the specific language governing permissions and limitations under
 # the License.
 
-import logging, traceback
+import functools, logging, traceback
+
+from lxml import etree
+from napalm.base.helpers import convert
+
+log = logging.getLogger(__file__)
 
 NSMAP = {
  "state_ns": "urn:nokia.com:sros:ns:yang:sr:state",
  "configure_ns": "urn:nokia.com:sros:ns:yang:sr:conf",
 }
 
+# convert(int, value) with its default bound up front, 0 like convert() picks for int
+_to_int = functools.partial(convert, int, default=0)
+
 def _find_txt(xml_tree, path, default="", namespaces=NSMAP):
     """
     Extracts the text value from an XML tree, using XPath.
@@ -30,15 +38,19 @@ def _find_txt(xml_tree, path, default="", namespaces=NSMAP):
 
     :param xml_tree:   the XML Tree object. Assumed is <type 'lxml.etree._Element'>.
     :param path:       XPath to be applied, in order to extract the desired data.
+                       Either a string or a compiled etree.XPath object.
     :param default:    Value to be returned in case of error.
     :param namespaces: prefix-namespace mappings to process XPath
     :return: a str value.
     """
     value = ""
     try:
-        xpath_applied = xml_tree.xpath(
-            path, namespaces=namespaces
-        )  # will consider the first match only
+        if isinstance(path, etree.XPath):
+            xpath_applied = path(xml_tree)
+        else:
+            xpath_applied = xml_tree.xpath(
+                path, namespaces=namespaces
+            )  # will consider the first match only
         xpath_length = len(xpath_applied)  # get a count of items in XML tree
         if xpath_length and xpath_applied[0] is not None:
             xpath_result = xpath_applied[0]
@@ -49,13 +61,84 @@ def _find_txt(xml_tree, path, default="", namespaces=NSMAP):
                 value = xpath_result
         else:
             if xpath_applied == "":
-                logging.error(
+                log.error(
                     "Unable to find the specified-text-element/XML path: %s in  \
                         the XML tree provided. Total Items in XML tree: %d "
                     % (path, xpath_length)
                 )
     except Exception as e:  # in case of any exception, returns default
         print("Error while finding text in xml: {}".format(e))
-        logging.error("Error while finding text in xml: %s" % traceback.format_exc())
+        log.error("Error while finding text in xml: %s" % traceback.format_exc())
         value = default
     return str(value)
+
+def _leaf_texts(xml_tree, prefix=""):
+    """
+    Collects the text of every leaf below an XML element in a single walk.
+
+    :param xml_tree: the XML Tree object. Assumed is <type 'lxml.etree._Element'>.
+    :param prefix:   prepended to the keys, used while descending.
+    :return: a dict mapping the '/' joined local names below xml_tree to the
+             stripped leaf text, e.g. {"received/messages": "12"}.
+    """
+    leaves = {}
+    for child in xml_tree:
+        if not isinstance(child.tag, str):  # comments, processing instructions
+            continue
+        name = prefix + etree.QName(child).localname
+        if len(child):
+            leaves.update(_leaf_texts(child, name + "/"))
+        else:
+            leaves[name] = child.text.strip() if child.text is not None else ""
+    return leaves
+
+
+def _merge_filters(*filters):
+    """
+    Merges NETCONF subtree filters into a single one selecting the union of their nodes.
+
+    Only selection and containment nodes are supported: a content match node narrows
+    its parent to the matching entries, which no merge of two filters can preserve
+    together with the siblings of the other filter.
+
+    :param filters: <filter> documents as str, without content match nodes.
+    :return: the merged <filter> document as str.
+    :raises ValueError: if one of the filters has a content match node.
+    """
+    parser = etree.XMLParser(remove_blank_text=True)
+    merged = None
+    for subtree_filter in filters:
+        root = etree.fromstring(subtree_filter.strip(), parser)
+        for element in root.iter():
+            if isinstance(element.tag, str) and (element.text or "").strip():
+                name = etree.QName(element).localname
+                raise ValueError(
+                    f"cannot merge the content match node <{name}>{element.text.strip()}</{name}>"
+                )
+        if merged is None:
+            merged = root
+        else:
+            _merge_selection(merged, root)
+    return etree.tostring(merged, encoding="unicode")
+
+def _merge_selection(target, source):
+    """
+    Adds the selection of a filter subtree to another one, in place.
+
+    :param target: the element to merge into, modified in place.
+    :param source: the element of the same path in the other filter, its children
+                   are moved into target.
+    """
+    existing = {child.tag: child for child in target if isinstance(child.tag, str)}
+    for child in list(source):  # appending moves the child out of source
+        if not isinstance(child.tag, str):  # comments, processing instructions
+            continue
+        match = existing.get(child.tag)
+        if match is None:
+            target.append(child)
+            existing[child.tag] = child
+        elif not len(match) or not len(child):
+            # a selection node without children selects the whole subtree
+            del match[:]
+        else:
+            _merge_selection(match, child)
@@ -21,6 +21,8 @@
 Napalm driver for SROS.
 """
 # import standard library
+import functools
+import ipaddress
 import json
 import time
 import re
@@ -48,7 +50,7 @@ import napalm.base.constants as C
 
 # import third party libraries
 from ncclient import manager
-from ncclient.xml_ import to_ele, to_xml
+from ncclient.xml_ import to_xml
 
 # import local modules
 from napalm_sros.utils.parse_output_to_dict import parse_with_textfsm
@@ -58,11 +60,335 @@ from napalm_sros.nc_filters import GET_ARP_TABLE,GET_BGP_CONFIG,GET_ENVIRONMENT,
      GET_NETWORK_INSTANCES,GET_NTP_PEERS,GET_NTP_SERVERS,GET_OPTICS, \
      GET_PROBES_CONFIG,GET_ROUTE_TO,GET_SNMP_INFORMATION,GET_USERS
 
-from .api import get_bgp_neighbors, get_bgp_neighbors_detail
+from .api import get_bgp_neighbors, get_bgp_neighbors_detail, GET_BGP_NEIGHBORS_ALL
+from .api.util import NSMAP, _merge_filters
 import logging
 
 log = logging.getLogger(__file__)
 
+# Clark notation namespace prefixes, for ElementPath lookups (find/findall/findtext)
+_CONF = "{" + NSMAP["configure_ns"] + "}"
+# multi-step paths read for every BGP group and neighbor, built once here
+_CONF_CLUSTER_ID = _CONF + "cluster/" + _CONF + "cluster-id"
+_CONF_LOCAL_AS_NUMBER = _CONF + "local-as/" + _CONF + "as-number"
+
+# BGP neighbor config and state plus the full BGP config, one reply shared by
+# get_bgp_neighbors, get_bgp_neighbors_detail and get_bgp_config when cache_ttl is set
+_GET_BGP_ALL = _merge_filters(
+    GET_BGP_NEIGHBORS_ALL, GET_BGP_CONFIG["_"].format(group_name="", neighbor="")
+)
+
+# Compiled XPath expressions, evaluated against NETCONF replies on every call
+_XP_ROUTER_BGP_NEIGHBOR = etree.XPath(
+    "state_ns:state/state_ns:router/state_ns:bgp/state_ns:neighbor", namespaces=NSMAP
+)
+_XP_VPRN_BGP_NEIGHBOR = etree.XPath(
+    "state_ns:state/state_ns:service/state_ns:vprn/state_ns:bgp/state_ns:neighbor",
+    namespaces=NSMAP,
+)
+_XP_ROUTER = etree.XPath("state_ns:state/state_ns:router", namespaces=NSMAP)
+_XP_ROUTER_NAME = etree.XPath(
+    "state_ns:router-name/text()", namespaces=NSMAP, smart_strings=False
+)
+_XP_VPRN = etree.XPath(
+    "state_ns:state/state_ns:service/state_ns:vprn", namespaces=NSMAP
+)
+_XP_VPRN_SERVICE_ID = etree.XPath(
+    "state_ns:oper-service-id/text()", namespaces=NSMAP, smart_strings=False
+)
+_XP_IP_ADDRESS = etree.XPath("state_ns:ip-address", namespaces=NSMAP)
+_XP_PEER_IDENTIFIER = etree.XPath(
+    "state_ns:statistics/state_ns:peer-identifier", namespaces=NSMAP
+)
+_XP_PEER_AS = etree.XPath("state_ns:statistics/state_ns:peer-as", namespaces=NSMAP)
+_XP_SAA_OWNER = etree.XPath(
+    "configure_ns:configure/configure_ns:saa/configure_ns:owner", namespaces=NSMAP
+)
+_XP_SAA_OWNER_NAME = etree.XPath("configure_ns:owner-name", namespaces=NSMAP)
+_XP_SAA_TEST = etree.XPath("configure_ns:test", namespaces=NSMAP)
+_XP_SAA_ICMP_DESTINATION = etree.XPath(
+    "configure_ns:type/configure_ns:icmp-ping/configure_ns:destination-address",
+    namespaces=NSMAP,
+)
+_XP_SAA_ICMP_SOURCE = etree.XPath(
+    "configure_ns:type/configure_ns:icmp-ping/configure_ns:source-address",
+    namespaces=NSMAP,
+)
+_XP_SAA_ICMP_COUNT = etree.XPath(
+    "configure_ns:type/configure_ns:icmp-ping/configure_ns:count", namespaces=NSMAP
+)
+_XP_SAA_ICMP_INTERVAL = etree.XPath(
+    "configure_ns:type/configure_ns:icmp-ping/configure_ns:interval", namespaces=NSMAP
+)
+_XP_BGP_INSTANCES = etree.XPath(
+    "configure_ns:configure/configure_ns:router/configure_ns:bgp"
+    " | configure_ns:configure/configure_ns:service/configure_ns:vprn/configure_ns:bgp",
+    namespaces=NSMAP,
+)
+_XP_REMOVE_PRIVATE = etree.XPath(
+    "boolean(configure_ns:remove-private/configure_ns:limited[normalize-space()='true'])",
+    namespaces=NSMAP,
+)
+# policy names as plain str, smart_strings=False skips the parent-tracking proxies
+_XP_POLICIES = {
+    direction: etree.XPath(
+        f"configure_ns:{direction}/configure_ns:policy/text()",
+        namespaces=NSMAP,
+        smart_strings=False,
+    )
+    for direction in ("import", "export")
+}
+_XP_BGP_NEIGHBOR_BY_IP = etree.XPath(
+    "configure_ns:neighbor[configure_ns:ip-address=$ip]", namespaces=NSMAP
+)
+# string(...) expressions evaluate to a str directly, no node list is built;
+# smart_strings=False makes it a plain str without a reference to the tree
+_XP_PARENT_AS = etree.XPath(
+    "string(../configure_ns:autonomous-system)", namespaces=NSMAP, smart_strings=False
+)
+_XP_MULTIPATH = {
+    xbgp: etree.XPath(
+        f"string(../configure_ns:multipath/configure_ns:{xbgp})",
+        namespaces=NSMAP,
+        smart_strings=False,
+    )
+    for xbgp in ("ibgp", "ebgp")
+}
+# Ports that are up and have an LLDP neighbor behind them; chassis-id is a
+# mandatory TLV, without it there is no neighbor
+_XP_LLDP_PORT = etree.XPath(
+    "state_ns:state/state_ns:port["
+    "translate(normalize-space(state_ns:oper-state), 'UP', 'up') = 'up'"
+    " and normalize-space(state_ns:port-id) != ''"
+    " and normalize-space(state_ns:ethernet/state_ns:lldp/state_ns:dest-mac"
+    "/state_ns:remote-system/state_ns:chassis-id) != '']",
+    namespaces=NSMAP,
+)
+_XP_PORT_ID = etree.XPath("state_ns:port-id", namespaces=NSMAP)
+_XP_STATE_PORT = etree.XPath("state_ns:state/state_ns:port", namespaces=NSMAP)
+# configured leaves of the port bound to $port_id, as strings
+_XP_PORT_CFG = {
+    leaf: etree.XPath(
+        "string(configure_ns:configure/configure_ns:port"
+        f"[configure_ns:port-id=$port_id]/{path})",
+        namespaces=NSMAP,
+    )
+    for leaf, path in (
+        ("admin-state", "configure_ns:admin-state"),
+        ("mtu", "configure_ns:ethernet/configure_ns:mtu"),
+        ("description", "configure_ns:description"),
+    )
+}
+_XP_PORT_STATISTICS = {
+    counter: etree.XPath(f"state_ns:statistics/state_ns:{counter}", namespaces=NSMAP)
+    for direction in ("in", "out")
+    for counter in (
+        f"{direction}-errors",
+        f"{direction}-discards",
+        f"{direction}-octets",
+        f"{direction}-unicast-packets",
+        f"{direction}-multicast-packets",
+        f"{direction}-broadcast-packets",
+    )
+}
+_XP_ROUTER_INTERFACE = etree.XPath(
+    "state_ns:state/state_ns:router/state_ns:interface", namespaces=NSMAP
+)
+_XP_INTERFACE_NAME = etree.XPath("state_ns:interface-name", namespaces=NSMAP)
+_XP_VPRN_INTERFACE = etree.XPath(
+    "state_ns:state/state_ns:service/state_ns:vprn/state_ns:interface", namespaces=NSMAP
+)
+_XP_IPV4_NEIGHBOR = etree.XPath(
+    "state_ns:ipv4/state_ns:neighbor-discovery/state_ns:neighbor", namespaces=NSMAP
+)
+_XP_IPV4_ADDRESS = etree.XPath("state_ns:ipv4-address", namespaces=NSMAP)
+_XP_MAC_ADDRESS = etree.XPath("state_ns:mac-address", namespaces=NSMAP)
+_XP_TIMER = etree.XPath("state_ns:timer", namespaces=NSMAP)
+_XP_CONF_IP_INTERFACES = etree.XPath(
+    "configure_ns:configure/configure_ns:router/configure_ns:interface"
+    " | configure_ns:configure/configure_ns:service/configure_ns:vprn/configure_ns:interface",
+    namespaces=NSMAP,
+)
+_XP_CONF_INTERFACE_NAME = etree.XPath("configure_ns:interface-name", namespaces=NSMAP)
+_CONF_IP_ADDRESS_PATHS = (
+    ("ipv4-primary", "configure_ns:ipv4/configure_ns:primary", "address"),
+    ("ipv4-secondary", "configure_ns:ipv4/configure_ns:secondary", "address"),
+    ("ipv6", "configure_ns:ipv6/configure_ns:address", "ipv6-address"),
+)
+_XP_CONF_IP_ADDRESS = {
+    kind: etree.XPath(f"{path}/configure_ns:{leaf}", namespaces=NSMAP)
+    for kind, path, leaf in _CONF_IP_ADDRESS_PATHS
+}
+_XP_CONF_PREFIX_LENGTH = {
+    kind: etree.XPath(f"{path}/configure_ns:prefix-length", namespaces=NSMAP)
+    for kind, path, _ in _CONF_IP_ADDRESS_PATHS
+}
+_XP_IP_STATISTICS = {
+    counter: etree.XPath(
+        f"state_ns:statistics/state_ns:ip/state_ns:{counter}", namespaces=NSMAP
+    )
+    for counter in ("out-discard-packets", "out-octets", "in-octets")
+}
+_XP_LLDP_REMOTE = {
+    leaf: etree.XPath(
+        "state_ns:ethernet/state_ns:lldp/state_ns:dest-mac/state_ns:remote-system/"
+        f"state_ns:{leaf}",
+        namespaces=NSMAP,
+    )
+    for leaf in (
+        "chassis-id",
+        "system-name",
+        "remote-port-id",
+        "port-description",
+        "system-description",
+    )
+}
+# capability lists are split in Python anyway, string(...) hands over the text directly
+_XP_LLDP_CAPABILITIES = {
+    leaf: etree.XPath(
+        "string(state_ns:ethernet/state_ns:lldp/state_ns:dest-mac/state_ns:remote-system/"
+        f"state_ns:{leaf})",
+        namespaces=NSMAP,
+        smart_strings=False,
+    )
+    for leaf in ("system-supported-capabilities", "system-enabled-capabilities")
+}
+_XP_FAN = etree.XPath("state_ns:state/state_ns:chassis/state_ns:fan", namespaces=NSMAP)
+_XP_FAN_SLOT = etree.XPath("state_ns:fan-slot", namespaces=NSMAP)
+# boolean(...) expressions compare in libxml2 and return a bool directly
+_XP_HW_IN_SERVICE = etree.XPath(
+    "boolean(state_ns:hardware-data/state_ns:oper-state[normalize-space()='in-service'])",
+    namespaces=NSMAP,
+)
+_XP_HW_TEMPERATURE = etree.XPath(
+    "state_ns:hardware-data/state_ns:temperature", namespaces=NSMAP
+)
+_XP_HW_TEMPERATURE_THRESHOLD = etree.XPath(
+    "state_ns:hardware-data/state_ns:temperature-threshold", namespaces=NSMAP
+)
+_XP_POWER_MODULE = etree.XPath(
+    "state_ns:state/state_ns:chassis/state_ns:power-shelf/state_ns:power-module",
+    namespaces=NSMAP,
+)
+_XP_POWER_MODULE_ID = etree.XPath("state_ns:power-module-id", namespaces=NSMAP)
+_XP_AVAILABLE_WATTAGE = etree.XPath("state_ns:available-wattage", namespaces=NSMAP)
+_XP_CPM = etree.XPath("state_ns:state/state_ns:cpm", namespaces=NSMAP)
+_XP_CARD = etree.XPath("state_ns:state/state_ns:card", namespaces=NSMAP)
+_XP_MDA = etree.XPath("state_ns:mda", namespaces=NSMAP)
+_XP_SYSTEM = etree.XPath("state_ns:state/state_ns:system", namespaces=NSMAP)
+_XP_SYSTEM_CPU = etree.XPath(
+    "state_ns:state/state_ns:system/state_ns:cpu", namespaces=NSMAP
+)
+_XP_AVAILABLE_MEMORY = etree.XPath(
+    "state_ns:memory-pools/state_ns:summary/state_ns:available-memory", namespaces=NSMAP
+)
+_XP_TOTAL_IN_USE = etree.XPath(
+    "state_ns:memory-pools/state_ns:summary/state_ns:total-in-use", namespaces=NSMAP
+)
+_XP_SAMPLE_PERIOD = etree.XPath("state_ns:sample-period", namespaces=NSMAP)
+_XP_CPU_USAGE = etree.XPath(
+    "state_ns:summary/state_ns:usage/state_ns:cpu-usage", namespaces=NSMAP
+)
+
+# Fields of interest in the "show saa <test-name>" output, one match per line
+_SAA_RESULTS_RE = re.compile(
+    r"^\s*(?:"
+    r"Test runs since last clear\s*:\s*(?P<runs>\d+)"
+    r"|Test Run:\s*(?P<run>\d+)"
+    r"|Total number of attempts:\s*(?P<attempts>\d+)"
+    r"|.*failed to be sent out:\s*(?P<failed>\d+)"
+    r"|Roundtrip\s*:\s*(?P<min>\S+)\s+(?P<max>\S+)\s+(?P<avg>\S+)\s+(?P<jitter>\S+)"
+    r")",
+    re.M,
+)
+
+# TextFSM template for "show service fdb-mac", relative to napalm_sros/utils
+_FDB_MAC_TEMPLATE = "textfsm_templates/nokia_sros_show_service_fdb_mac.tpl"
+
+# Numeric fields of the "show router bgp routes ... detail" output
+_LOCAL_AS_RE = re.compile(r"Local AS\D+(\d+)")
+_LOCAL_PREF_RE = re.compile(r"Local Pref\.\s*:\s*(\d+)")
+
+# Lines of the "show chassis power-management utilization detail" output
+_POWER_MODULE_LINE_RE = re.compile(r"^.*Power Module", re.MULTILINE)
+_POWER_UTIL_RE = re.compile(
+    r"^(?=.*Current Util\.).*:\s*(\d+[.]\d+) Watts", re.MULTILINE
+)
+
+# Characters of an IPv6 address, screened before the ipaddress parse
+_IPV6_CHARS = frozenset("0123456789abcdefABCDEF:.")
+
+# ping and traceroute commands, keyed by (source given, vrf given)
+_PING_CMDS = {
+    (True, True): (
+        "ping {d1} timeout {d2} ttl {d3} source-address {d4} size {d5} "
+        "count {d6} router-instance {d7}"
+    ),
+    (False, False): "ping {d1} timeout {d2} ttl {d3} size {d5} count {d6}",
+    (True, False): "ping {d1} timeout {d2} ttl {d3} source-address {d4} size {d5} count {d6}",
+    (False, True): "ping {d1} timeout {d2} ttl {d3} size {d5} count {d6} router-instance {d7}",
+}
+_TRACEROUTE_CMDS = {
+    (True, True): "traceroute {d1} wait {d2} ttl {d3} source-address {d4} router-instance {d5}",
+    (False, False): "traceroute {d1} wait {d2} ttl {d3}",
+    (True, False): "traceroute {d1} wait {d2} ttl {d3} source-address {d4}",
+    (False, True): "traceroute {d1} wait {d2} ttl {d3} router-instance {d5}",
+}
+
+# Lines of interest in the ping and traceroute outputs, the first alternative
+# a line matches names its kind
+_PING_LINE_RE = re.compile(
+    r"^(?:"
+    r"(?P<error>.*No route to destination.*)"
+    r"|(?P<probe>.*icmp_seq.*)"
+    r"|(?P<packets>.*packets.*)"
+    r"|(?P<round_trip>.*round-trip.*)"
+    r")$",
+    re.MULTILINE,
+)
+_TRACEROUTE_LINE_RE = re.compile(
+    r"^(?:(?P<error>.*\* \* \*.*)|(?P<hop>.*ms.*))$", re.MULTILINE
+)
+
+# A CLI prompt line echoed back in the command output
+_CMD_LINE_PATTERN_RE = re.compile(r"\*?(.*?)(>.*)*#.*?")
+# The prompt, alone or echoing the next command, between two outputs of a CLI batch
+_CLI_PROMPT_LINE_RE = re.compile(r"^\*?[ABCD]:\S+@\S+#")
+
+_AGE_WITH_DAYS_SPLIT_RE = re.compile("d|h|m")
+_AGE_SPLIT_RE = re.compile("h|m|s")
+
+
+def _route_age(age_string):
+    """Return the Age field of a route-table entry as an integer."""
+    if "d" in age_string:
+        fields = _AGE_WITH_DAYS_SPLIT_RE.split(age_string)
+    else:
+        fields = _AGE_SPLIT_RE.split(age_string)
+    return int(fields[0]) * 86400 + int(fields[1]) * 3600 + int(fields[2]) * 60
+
+
+def _starts_with_ipv6(line):
+    """Return True if the first field of a CLI output line is an IPv6 address."""
+    fields = line.split(None, 1)
+    if not fields:
+        return False
+    address = fields[0].partition("%")[0]  # drop a link-local scope
+    # cheap character screen first, MAC addresses still fail the parse below
+    if ":" not in address or not _IPV6_CHARS.issuperset(address):
+        return False
+    try:
+        return ipaddress.ip_address(address).version == 6
+    except ValueError:
+        return False
+
+
+@functools.lru_cache(maxsize=256)
+def _as_number(as_number_str):
+    """as_number() memoized, a device only reports a handful of distinct AS values."""
+    return as_number(as_number_str)
+
+
 class NokiaSROSDriver(NetworkDriver):
     """Napalm driver for Skeleton."""
 
@@ -94,10 +420,7 @@ class NokiaSROSDriver(NetworkDriver):
             + "(([2][5][0-5])|([2][0-4][0-9])|([0-1]?[0-9]?[0-9]))"
         )
 
-        self.ipv6_address_re = re.compile(
-          r"(([0-9a-fA-F]{1,4}:){7,7}[0-9a-fA-F]{1,4}|([0-9a-fA-F]{1,4}:){1,7}:|([0-9a-fA-F]{1,4}:){1,6}:[0-9a-fA-F]{1,4}|([0-9a-fA-F]{1,4}:){1,5}(:[0-9a-fA-F]{1,4}){1,2}|([0-9a-fA-F]{1,4}:){1,4}(:[0-9a-fA-F]{1,4}){1,3}|([0-9a-fA-F]{1,4}:){1,3}(:[0-9a-fA-F]{1,4}){1,4}|([0-9a-fA-F]{1,4}:){1,2}(:[0-9a-fA-F]{1,4}){1,5}|[0-9a-fA-F]{1,4}:((:[0-9a-fA-F]{1,4}){1,6})|:((:[0-9a-fA-F]{1,4}){1,7}|:)|fe80:(:[0-9a-fA-F]{0,4}){0,4}%[0-9a-zA-Z]{1,}|::(ffff(:0{1,4}){0,1}:){0,1}((25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])\.){3,3}(25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])|([0-9a-fA-F]{1,4}:){1,4}:((25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])\.){3,3}(25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9]))"
-        )
-        self.cmd_line_pattern_re = re.compile(r"\*?(.*?)(>.*)*#.*?")
+        self.cmd_line_pattern_re = _CMD_LINE_PATTERN_RE
 
         if optional_args is None:
             optional_args = {}
@@ -106,16 +429,22 @@ class NokiaSROSDriver(NetworkDriver):
         self.port = optional_args.get("port", 830)
         self.conn_ssh = optional_args.get("ssh_conn", None)
         self.ssh_channel = optional_args.get("ssh_channel", None)
+        # paging is a property of the CLI session, disabled once per SSH channel
+        self._cli_more_disabled = False
 
         # locking variables
         self.lock_disable = optional_args.get("lock_disable", False)
         self.session_config_lock = optional_args.get("config_lock", False)
 
-        # namespace map
-        self.nsmap = {
-            "state_ns": "urn:nokia.com:sros:ns:yang:sr:state",
-            "configure_ns": "urn:nokia.com:sros:ns:yang:sr:conf",
-        }
+        # seconds a NETCONF reply may be shared between getters, 0 disables reuse
+        self.cache_ttl = optional_args.get("cache_ttl", 0)
+        self._probes_cfg_etree = None
+        self._probes_cfg_ts = 0.0
+        self._bgp_etree = None
+        self._bgp_ts = 0.0
+
+        # namespace map, the one the module level XPath objects are compiled with
+        self.nsmap = NSMAP
         self.optional_args = None
 
     def open(self):
@@ -152,6 +481,8 @@ class NokiaSROSDriver(NetworkDriver):
     def close(self):
         """Implement the NAPALM method close (mandatory)"""
         # Close the NETCONF connection with the host
+        self._probes_cfg_etree = None
+        self._bgp_etree = None
 
         # netconf connection
         if self.conn is not None:
@@ -159,6 +490,7 @@ class NokiaSROSDriver(NetworkDriver):
         # ssh connection
         if self.conn_ssh is not None:
             self.conn_ssh.close()
+        self._cli_more_disabled = False
 
     def _create_ssh(self):
         try:
@@ -172,22 +504,25 @@ class NokiaSROSDriver(NetworkDriver):
                 timeout = self.timeout
             )
             self.ssh_channel = self.conn_ssh.invoke_shell()
+            self._cli_more_disabled = False
         except Exception as e:
             print("Error in opening a ssh connection: {}".format(e))
             log.error("Error in opening a ssh connection: %s" % traceback.format_exc())
 
     def _perform_cli_commands(self, commands, is_get, no_more=False):
-        if no_more:
-            # Disable paged responses, note that the '/' changes the filenames
-            # for mocked data responses under test/unit/mocked_data
-            # - they now require a leading '_'
-            commands = ["/environment more false"] + commands
         try:
             is_alive = False
             if self.conn_ssh is not None:
                 is_alive = self.conn_ssh.get_transport().is_active()
             if not is_alive:
                 self._create_ssh()
+            disable_more = no_more and not self._cli_more_disabled
+            if disable_more:
+                # Disable paged responses, note that the '/' changes the filenames
+                # for mocked data responses under test/unit/mocked_data
+                # - they now require a leading '_'
+                # The setting lasts for the SSH session, so it is only sent once
+                commands = ["/environment more false"] + commands
             buff = ""
             if is_get:
                 for command in commands:
@@ -240,6 +575,10 @@ class NokiaSROSDriver(NetworkDriver):
                     resp = self.ssh_channel.recv(999)
                     buff += resp.decode("ascii")
 
+            # only remembered once the commands went through, a failure
+            # above sends the setting again with the next batch
+            if disable_more:
+                self._cli_more_disabled = True
             return buff
         except Exception as e:
             print("Error in method perform cli commands : {}".format(e))
@@ -277,15 +616,19 @@ class NokiaSROSDriver(NetworkDriver):
 
         :param xml_tree:   the XML Tree object. Assumed is <type 'lxml.etree._Element'>.
         :param path:       XPath to be applied, in order to extract the desired data.
+                           Either a string or a compiled etree.XPath object.
         :param default:    Value to be returned in case of error.
         :param namespaces: prefix-namespace mappings to process XPath
         :return: a str value.
         """
         value = ""
         try:
-            xpath_applied = xml_tree.xpath(
-                path, namespaces=namespaces
-            )  # will consider the first match only
+            if isinstance(path, etree.XPath):
+                xpath_applied = path(xml_tree)
+            else:
+                xpath_applied = xml_tree.xpath(
+                    path, namespaces=namespaces
+                )  # will consider the first match only
             xpath_length = len(xpath_applied)  # get a count of items in XML tree
             if xpath_length and xpath_applied[0] is not None:
                 xpath_result = xpath_applied[0]
@@ -341,6 +684,9 @@ class NokiaSROSDriver(NetworkDriver):
         """
         Commits the changes requested by the method load_replace_candidate or load_merge_candidate.
         """
+        # cached configuration is stale after a commit
+        self._probes_cfg_etree = None
+        self._bgp_etree = None
         if self.fmt == "text":
             buff = self._perform_cli_commands(["commit"], True)
             # If error while performing commit, return the error
@@ -362,6 +708,9 @@ class NokiaSROSDriver(NetworkDriver):
         """
         If changes were made, revert changes to the original state.
         """
+        # cached configuration is stale after a rollback
+        self._probes_cfg_etree = None
+        self._bgp_etree = None
         cmd = ["/quit-config", "/configure exclusive", "rollback 1", "commit", "exit"]
         buff = self._perform_cli_commands(cmd, True)
         error = ""
@@ -412,12 +761,11 @@ class NokiaSROSDriver(NetworkDriver):
 
             return new_buff
         if buff is not None:
-            new_buff = ""
+            rows = []
             first_compare = False
             for item in buff.split("\n"):
                 if any(match.search(item) for match in self.terminal_stderr_re):
-                    row = item.strip()
-                    new_buff += row
+                    rows.append(item.strip())
                     break
                 if not first_compare and "compare" in item:
                     first_compare = True
@@ -436,9 +784,8 @@ class NokiaSROSDriver(NetworkDriver):
                         continue
                     if "configure" in row:
                         row = row.lstrip()
-                    new_buff += row
-                    new_buff += "\n"
-            return new_buff.rstrip("\n")
+                    rows.append(row)
+            return "\n".join(rows).rstrip("\n")
         else:
             return ""
 
@@ -570,53 +917,36 @@ class NokiaSROSDriver(NetworkDriver):
         """
         try:
             interface_list = []
-            result = to_ele(self.conn.get(filter=GET_FACTS["_"]).data_xml)
+            result = self.conn.get(filter=GET_FACTS["_"]).data_ele
+            # one evaluator per reply, the namespaces are registered once for all lookups
+            xpe = etree.XPathEvaluator(result, namespaces=self.nsmap, smart_strings=False)
 
-            hostname = self._find_txt(
-                result,
-                "state_ns:state/state_ns:system/state_ns:oper-name",
-                default="",
-                namespaces=self.nsmap,
-            )
+            def _txt(path):
+                return xpe(f"string({path})").strip()
+
+            hostname = _txt("state_ns:state/state_ns:system/state_ns:oper-name")
             fqdn = hostname
-            uptime = self._find_txt(
-                result,
-                "state_ns:state/state_ns:system/state_ns:up-time",
-                default="",
-                namespaces=self.nsmap,
-            )
+            uptime = _txt("state_ns:state/state_ns:system/state_ns:up-time")
             # In uptime, last three digits are milliseconds
             if uptime:
                 uptime = uptime[:-3]+ "." + uptime[-3:]
                 uptime = convert(float, uptime, default=0.0)
             else:
                 uptime = -1.0
-            interfaces = result.xpath(
-                "state_ns:state/state_ns:router/state_ns:interface/state_ns:interface-name",
-                namespaces=self.nsmap,
+            interfaces = xpe(
+                "state_ns:state/state_ns:router/state_ns:interface/state_ns:interface-name"
             )
             for i in interfaces:
                 interface_list.append(i.text)
 
             return {
                 "vendor": "Nokia",
-                "model": self._find_txt(
-                    result,
-                    "state_ns:state/state_ns:system/state_ns:platform",
-                    default="",
-                    namespaces=self.nsmap,
+                "model": _txt("state_ns:state/state_ns:system/state_ns:platform"),
+                "serial_number": _txt(
+                    "state_ns:state/state_ns:chassis/state_ns:hardware-data/state_ns:serial-number"
                 ),
-                "serial_number": self._find_txt(
-                    result,
-                    "state_ns:state/state_ns:chassis/state_ns:hardware-data/state_ns:serial-number",
-                    default="",
-                    namespaces=self.nsmap,
-                ),
-                "os_version": self._find_txt(
-                    result,
-                    "state_ns:state/state_ns:system/state_ns:version/state_ns:version-number",
-                    default="",
-                    namespaces=self.nsmap,
+                "os_version": _txt(
+                    "state_ns:state/state_ns:system/state_ns:version/state_ns:version-number"
                 ),
                 "hostname": hostname,
                 "fqdn": fqdn,
@@ -644,13 +974,19 @@ class NokiaSROSDriver(NetworkDriver):
          """
         try:
             interfaces = {}
-            result = to_ele(
-                self.conn.get(
-                    filter=GET_INTERFACES(R19=self.R19), with_defaults="report-all"
-                ).data_xml
+            result = self.conn.get(
+                filter=GET_INTERFACES(R19=self.R19), with_defaults="report-all"
+            ).data_ele
+            # one evaluator for all the queries rooted at the reply
+            xpe = etree.XPathEvaluator(
+                result, namespaces=self.nsmap, smart_strings=False
             )
+
+            def _port_cfg(port_id, leaf):
+                return _XP_PORT_CFG[leaf](result, port_id=port_id).strip()
+
             # get physical interfaces (ports) information
-            for port in result.xpath("state_ns:state/state_ns:port", namespaces=self.nsmap):
+            for port in xpe("state_ns:state/state_ns:port"):
                 port_id = self._find_txt(
                     port, "state_ns:port-id", namespaces=self.nsmap
                 )  # port name
@@ -661,10 +997,8 @@ class NokiaSROSDriver(NetworkDriver):
                     port, "state_ns:hardware-mac-address", namespaces=self.nsmap
                 )
                 pd["is_up"] = (
-                    True
-                    if self._find_txt(port, "state_ns:oper-state", namespaces=self.nsmap)
+                    self._find_txt(port, "state_ns:oper-state", namespaces=self.nsmap)
                     == "up"
-                    else False
                 )
                 pd["speed"] = convert(
                     float,
@@ -674,43 +1008,17 @@ class NokiaSROSDriver(NetworkDriver):
                 )
                 pd["last_flapped"] = -1.0  # flap information is not available in YANG yet
                 pd["is_enabled"] = (
-                    True
-                    if self._find_txt(
-                        result,
-                        'configure_ns:configure/configure_ns:port[configure_ns:port-id="{}"]/configure_ns:admin-state'.format(
-                            port_id
-                        ),
-                        namespaces=self.nsmap,
-                    )
-                    == "enable"
-                    else False
+                    _port_cfg(port_id, "admin-state") == "enable"
                 )
                 pd["mtu"] = convert(
-                    int,
-                    self._find_txt(
-                        result,
-                        'configure_ns:configure/configure_ns:port[configure_ns:port-id="{}"]/configure_ns:ethernet/configure_ns:mtu'.format(
-                            port_id
-                        ),
-                        namespaces=self.nsmap,
-                    ),
-                )
-                pd["description"] = self._find_txt(
-                    result,
-                    'configure_ns:configure/configure_ns:port[configure_ns:port-id="{}"]/configure_ns:description'.format(
-                        port_id
-                    ),
-                    namespaces=self.nsmap,
+                    int, _port_cfg(port_id, "mtu")
                 )
+                pd["description"] = _port_cfg(port_id, "description")
                 interfaces[port_id] = pd
 
             # get logical interfaces (interfaces) information
-            for if_state in result.xpath(
-                "state_ns:state/state_ns:router/state_ns:interface", namespaces=self.nsmap
-            ):
-                if_name = self._find_txt(
-                    if_state, "state_ns:interface-name", namespaces=self.nsmap
-                )
+            for if_state in xpe("state_ns:state/state_ns:router/state_ns:interface"):
+                if_name = self._find_txt(if_state, _XP_INTERFACE_NAME)
                 if if_name == "":
                     continue
                 ifd = {}  # interface dict
@@ -744,12 +1052,10 @@ class NokiaSROSDriver(NetworkDriver):
 
                     # configured admin-state
                     ifd["is_enabled"] = (
-                        True
-                        if self._find_txt(
+                        self._find_txt(
                             if_cfg_block, "configure_ns:admin-state", namespaces=self.nsmap
                         )
                         == "enable"
-                        else False
                     )
 
                 # state portion of the port associated with interface
@@ -771,11 +1077,10 @@ class NokiaSROSDriver(NetworkDriver):
                             )
                     else:
                         # system interface gets chassis MAC
-                        if_mac = self._find_txt(
-                            result,
-                            "state_ns:state/state_ns:chassis/state_ns:hardware-data/state_ns:base-mac-address",
-                            namespaces=self.nsmap,
-                        )
+                        if_mac = xpe(
+                            "string(state_ns:state/state_ns:chassis/state_ns:hardware-data"
+                            "/state_ns:base-mac-address)"
+                        ).strip()
                 ifd["mac_address"] = if_mac
 
                 # speed is a port inherited value
@@ -839,133 +1144,79 @@ class NokiaSROSDriver(NetworkDriver):
         """
         try:
             interface_counters = {}
-            result = to_ele(
-                self.conn.get(
-                    filter=GET_INTERFACES_COUNTERS["_"], with_defaults="report-all"
-                ).data_xml
-            )
+            result = self.conn.get(
+                filter=GET_INTERFACES_COUNTERS["_"], with_defaults="report-all"
+            ).data_ele
             # Looping through port-list to get statistics of individual port
-            for port in result.xpath("state_ns:state/state_ns:port", namespaces=self.nsmap):
-                port_id = self._find_txt(port, "state_ns:port-id", namespaces=self.nsmap)
+            for port in _XP_STATE_PORT(result):
+                port_id = self._find_txt(port, _XP_PORT_ID)
                 if port_id == "":
                     continue
                 interface_counters[port_id] = {
                     "tx_errors": convert(
                         int,
-                        self._find_txt(
-                            port,
-                            "state_ns:statistics/state_ns:out-errors",
-                            namespaces=self.nsmap,
-                        ),
+                        self._find_txt(port, _XP_PORT_STATISTICS["out-errors"]),
                         default=-1,
                     ),
                     "rx_errors": convert(
                         int,
-                        self._find_txt(
-                            port,
-                            "state_ns:statistics/state_ns:in-errors",
-                            namespaces=self.nsmap,
-                        ),
+                        self._find_txt(port, _XP_PORT_STATISTICS["in-errors"]),
                         default=-1,
                     ),
                     "tx_discards": convert(
                         int,
-                        self._find_txt(
-                            port,
-                            "state_ns:statistics/state_ns:out-discards",
-                            namespaces=self.nsmap,
-                        ),
+                        self._find_txt(port, _XP_PORT_STATISTICS["out-discards"]),
                         default=-1,
                     ),
                     "rx_discards": convert(
                         int,
-                        self._find_txt(
-                            port,
-                            "state_ns:statistics/state_ns:in-discards",
-                            namespaces=self.nsmap,
-                        ),
+                        self._find_txt(port, _XP_PORT_STATISTICS["in-discards"]),
                         default=-1,
                     ),
                     "tx_octets": convert(
                         int,
-                        self._find_txt(
-                            port,
-                            "state_ns:statistics/state_ns:out-octets",
-                            namespaces=self.nsmap,
-                        ),
+                        self._find_txt(port, _XP_PORT_STATISTICS["out-octets"]),
                         default=-1,
                     ),
                     "rx_octets": convert(
                         int,
-                        self._find_txt(
-                            port,
-                            "state_ns:statistics/state_ns:in-octets",
-                            namespaces=self.nsmap,
-                        ),
+                        self._find_txt(port, _XP_PORT_STATISTICS["in-octets"]),
                         default=-1,
                     ),
                     "tx_unicast_packets": convert(
                         int,
-                        self._find_txt(
-                            port,
-                            "state_ns:statistics/state_ns:out-unicast-packets",
-                            namespaces=self.nsmap,
-                        ),
+                        self._find_txt(port, _XP_PORT_STATISTICS["out-unicast-packets"]),
                         default=-1,
                     ),
                     "rx_unicast_packets": convert(
                         int,
-                        self._find_txt(
-                            port,
-                            "state_ns:statistics/state_ns:in-unicast-packets",
-                            namespaces=self.nsmap,
-                        ),
+                        self._find_txt(port, _XP_PORT_STATISTICS["in-unicast-packets"]),
                         default=-1,
                     ),
                     "tx_multicast_packets": convert(
                         int,
-                        self._find_txt(
-                            port,
-                            "state_ns:statistics/state_ns:out-multicast-packets",
-                            namespaces=self.nsmap,
-                        ),
+                        self._find_txt(port, _XP_PORT_STATISTICS["out-multicast-packets"]),
                         default=-1,
                     ),
                     "rx_multicast_packets": convert(
                         int,
-                        self._find_txt(
-                            port,
-                            "state_ns:statistics/state_ns:in-multicast-packets",
-                            namespaces=self.nsmap,
-                        ),
+                        self._find_txt(port, _XP_PORT_STATISTICS["in-multicast-packets"]),
                         default=-1,
                     ),
                     "tx_broadcast_packets": convert(
                         int,
-                        self._find_txt(
-                            port,
-                            "state_ns:statistics/state_ns:out-broadcast-packets",
-                            namespaces=self.nsmap,
-                        ),
+                        self._find_txt(port, _XP_PORT_STATISTICS["out-broadcast-packets"]),
                         default=-1,
                     ),
                     "rx_broadcast_packets": convert(
                         int,
-                        self._find_txt(
-                            port,
-                            "state_ns:statistics/state_ns:in-broadcast-packets",
-                            namespaces=self.nsmap,
-                        ),
+                        self._find_txt(port, _XP_PORT_STATISTICS["in-broadcast-packets"]),
                         default=-1,
                     ),
                 }
             # Looping through interfaces-list to get statistics of interfaces port
-            for iface in result.xpath(
-                "state_ns:state/state_ns:router/state_ns:interface", namespaces=self.nsmap
-            ):
-                if_name = self._find_txt(
-                    iface, "state_ns:interface-name", namespaces=self.nsmap
-                )
+            for iface in _XP_ROUTER_INTERFACE(result):
+                if_name = self._find_txt(iface, _XP_INTERFACE_NAME)
                 if if_name == "":
                     continue
                 interface_counters[if_name] = {
@@ -973,30 +1224,18 @@ class NokiaSROSDriver(NetworkDriver):
                     "rx_errors": -1,
                     "tx_discards": convert(
                         int,
-                        self._find_txt(
-                            iface,
-                            "state_ns:statistics/state_ns:ip/state_ns:out-discard-packets",
-                            namespaces=self.nsmap,
-                        ),
+                        self._find_txt(iface, _XP_IP_STATISTICS["out-discard-packets"]),
                         default=-1,
                     ),
                     "rx_discards": -1,
                     "tx_octets": convert(
                         int,
-                        self._find_txt(
-                            iface,
-                            "state_ns:statistics/state_ns:ip/state_ns:out-octets",
-                            namespaces=self.nsmap,
-                        ),
+                        self._find_txt(iface, _XP_IP_STATISTICS["out-octets"]),
                         default=-1,
                     ),
                     "rx_octets": convert(
                         int,
-                        self._find_txt(
-                            iface,
-                            "state_ns:statistics/state_ns:ip/state_ns:in-octets",
-                            namespaces=self.nsmap,
-                        ),
+                        self._find_txt(iface, _XP_IP_STATISTICS["in-octets"]),
                         default=-1,
                     ),
                     "tx_unicast_packets": -1,
@@ -1028,12 +1267,11 @@ class NokiaSROSDriver(NetworkDriver):
         try:
             network_instances = {}
 
-            result = to_ele(
-                self.conn.get(
-                    filter=GET_NETWORK_INSTANCES["_"].format(instance_name=name),
-                    with_defaults="report-all",
-                ).data_xml
-            )
+            result = self.conn.get(
+                filter=GET_NETWORK_INSTANCES["_"].format(instance_name=name),
+                with_defaults="report-all",
+            ).data_ele
+            xpe = etree.XPathEvaluator(result, namespaces=self.nsmap)
 
             # helper
             def _get_interfaces_list(instance):
@@ -1060,9 +1298,7 @@ class NokiaSROSDriver(NetworkDriver):
                         {interface_name: {}}
                     )
 
-            for router in result.xpath(
-                "state_ns:state/state_ns:router", namespaces=self.nsmap
-            ):
+            for router in xpe("state_ns:state/state_ns:router"):
                 instance_name = self._find_txt(
                     router, "state_ns:router-name", namespaces=self.nsmap
                 )
@@ -1074,9 +1310,7 @@ class NokiaSROSDriver(NetworkDriver):
                     network_instances.update({instance_name: {"type": "MGMT"}})
                 _get_interfaces_list(router)
 
-            for vprn_service in result.xpath(
-                "state_ns:state/state_ns:service/state_ns:vprn", namespaces=self.nsmap
-            ):
+            for vprn_service in xpe("state_ns:state/state_ns:service/state_ns:vprn"):
                 instance_name = self._find_txt(
                     vprn_service, "state_ns:service-name", namespaces=self.nsmap
                 )
@@ -1085,9 +1319,7 @@ class NokiaSROSDriver(NetworkDriver):
                 network_instances.update({instance_name: {"type": "L3VRF"}})
                 _get_interfaces_list(vprn_service)
 
-            for vpls_service in result.xpath(
-                "state_ns:state/state_ns:service/state_ns:vpls", namespaces=self.nsmap
-            ):
+            for vpls_service in xpe("state_ns:state/state_ns:service/state_ns:vpls"):
                 instance_name = self._find_txt(
                     vpls_service, "state_ns:service-name", namespaces=self.nsmap
                 )
@@ -1194,9 +1426,7 @@ class NokiaSROSDriver(NetworkDriver):
             elif self.sros_get_format == "xml" or format == "xml":
                 config_data_running_xml = ""
                 if retrieve == "running" or retrieve == "all":
-                    config_data_running = to_ele(
-                        self.conn.get_config(source="running").data_xml
-                    )
+                    config_data_running = self.conn.get_config(source="running").data_ele
                     config_data_running_xml = to_xml(
                         config_data_running.xpath(
                             "configure_ns:configure", namespaces=self.nsmap
@@ -1212,9 +1442,7 @@ class NokiaSROSDriver(NetworkDriver):
                     configuration["startup"] = config_data_running_xml
 
                 if retrieve == "candidate" or retrieve == "all":
-                    config_data_candidate = to_ele(
-                        self.conn.get_config(source="candidate").data_xml
-                    )
+                    config_data_candidate = self.conn.get_config(source="candidate").data_ele
                     config_data_candidate_xml = to_xml(
                         config_data_candidate.xpath(
                             "configure_ns:configure", namespaces=self.nsmap
@@ -1259,9 +1487,7 @@ class NokiaSROSDriver(NetworkDriver):
         try:
             optics_dict = {}
 
-            result = to_ele(
-                self.conn.get(filter=GET_OPTICS["_"], with_defaults="report-all").data_xml
-            )
+            result = self.conn.get(filter=GET_OPTICS["_"], with_defaults="report-all").data_ele
 
             for port in result.xpath("state_ns:state/state_ns:port", namespaces=self.nsmap):
                 port_id = self._find_txt(
@@ -1357,63 +1583,31 @@ class NokiaSROSDriver(NetworkDriver):
                 arp_table.append(
                     {
                         "interface": interface_name,
-                        "mac": self._find_txt(
-                            neighbor_discovered,
-                            "state_ns:mac-address",
-                            namespaces=self.nsmap,
-                        ),
-                        "ip": self._find_txt(
-                            neighbor_discovered,
-                            "state_ns:ipv4-address",
-                            namespaces=self.nsmap,
-                        ),
+                        "mac": self._find_txt(neighbor_discovered, _XP_MAC_ADDRESS),
+                        "ip": self._find_txt(neighbor_discovered, _XP_IPV4_ADDRESS),
                         "age": convert(
-                            float,
-                            self._find_txt(
-                                neighbor_discovered,
-                                "state_ns:timer",
-                                namespaces=self.nsmap,
-                            ),
+                            float, self._find_txt(neighbor_discovered, _XP_TIMER)
                         ),
                     }
                 )
 
-            result = to_ele(
-                self.conn.get(
-                    filter=GET_ARP_TABLE["_"].format(vrf=vrf), with_defaults="report-all",
-                ).data_xml
-            )
+            result = self.conn.get(
+                filter=GET_ARP_TABLE["_"].format(vrf=vrf), with_defaults="report-all",
+            ).data_ele
 
-            for interface in result.xpath(
-                "state_ns:state/state_ns:router/state_ns:interface", namespaces=self.nsmap
-            ):
-                interface_name = self._find_txt(
-                    interface, "state_ns:interface-name", namespaces=self.nsmap
-                )
+            for interface in _XP_ROUTER_INTERFACE(result):
+                interface_name = self._find_txt(interface, _XP_INTERFACE_NAME)
 
-                for neighbor in interface.xpath(
-                    "state_ns:ipv4/state_ns:neighbor-discovery/state_ns:neighbor",
-                    namespaces=self.nsmap,
-                ):
+                for neighbor in _XP_IPV4_NEIGHBOR(interface):
 
-                    discovered_nei_ip = self._find_txt(
-                        neighbor, "state_ns:ipv4-address", namespaces=self.nsmap,
-                    )
+                    discovered_nei_ip = self._find_txt(neighbor, _XP_IPV4_ADDRESS)
                     if discovered_nei_ip == "":
                         continue
                     _get_arp_table(neighbor)
 
-            for interface in result.xpath(
-                "state_ns:state/state_ns:service/state_ns:vprn/state_ns:interface",
-                namespaces=self.nsmap,
-            ):
-                for neighbor in interface.xpath(
-                    "state_ns:ipv4/state_ns:neighbor-discovery/state_ns:neighbor",
-                    namespaces=self.nsmap,
-                ):
-                    discovered_nei_ip = self._find_txt(
-                        interface, "state_ns:ipv4-address", namespaces=self.nsmap,
-                    )
+            for interface in _XP_VPRN_INTERFACE(result):
+                for neighbor in _XP_IPV4_NEIGHBOR(interface):
+                    discovered_nei_ip = self._find_txt(interface, _XP_IPV4_ADDRESS)
                     if discovered_nei_ip == "":
                         continue
                     _get_arp_table(neighbor)
@@ -1435,75 +1629,44 @@ class NokiaSROSDriver(NetworkDriver):
         try:
             interfaces_ip = {}
 
-            result = to_ele(
-                self.conn.get(
-                    filter=GET_INTERFACES_IP["_"], with_defaults="report-all"
-                ).data_xml
-            )
-
-            xpath_iface_filter = "configure_ns:configure/configure_ns:router/configure_ns:interface | \
-                            configure_ns:configure/configure_ns:service/configure_ns:vprn/configure_ns:interface"
+            result = self.conn.get(
+                filter=GET_INTERFACES_IP["_"], with_defaults="report-all"
+            ).data_ele
 
-            for interface in result.xpath(xpath_iface_filter, namespaces=self.nsmap):
-                interface_name = self._find_txt(
-                    interface, "configure_ns:interface-name", namespaces=self.nsmap
-                )
+            for interface in _XP_CONF_IP_INTERFACES(result):
+                interface_name = self._find_txt(interface, _XP_CONF_INTERFACE_NAME)
                 if interface_name == "":
                     continue
                 interfaces_ip[interface_name] = {}
-                ipv4_primary_address = self._find_txt(
-                    interface,
-                    "configure_ns:ipv4/configure_ns:primary/configure_ns:address",
-                    namespaces=self.nsmap,
-                )
+                ipv4_primary_address = self._find_txt(interface, _XP_CONF_IP_ADDRESS["ipv4-primary"])
                 if ipv4_primary_address != "":
                     interfaces_ip[interface_name]["ipv4"] = {
                         ipv4_primary_address: {
                             "prefix_length": convert(
                                 int,
-                                self._find_txt(
-                                    interface,
-                                    "configure_ns:ipv4/configure_ns:primary/configure_ns:prefix-length",
-                                    namespaces=self.nsmap,
-                                ),
+                                self._find_txt(interface, _XP_CONF_PREFIX_LENGTH["ipv4-primary"]),
                                 default="N/A",
                             )
                         }
                     }
-                ipv4_secondary_address = self._find_txt(
-                    interface,
-                    "configure_ns:ipv4/configure_ns:secondary/configure_ns:address",
-                    namespaces=self.nsmap,
-                )
+                ipv4_secondary_address = self._find_txt(interface, _XP_CONF_IP_ADDRESS["ipv4-secondary"])
                 if ipv4_secondary_address != "":
                     interfaces_ip[interface_name]["ipv4"] = {
                         ipv4_secondary_address: {
                             "prefix_length": convert(
                                 int,
-                                self._find_txt(
-                                    interface,
-                                    "configure_ns:ipv4/configure_ns:secondary/configure_ns:prefix-length",
-                                    namespaces=self.nsmap,
-                                ),
+                                self._find_txt(interface, _XP_CONF_PREFIX_LENGTH["ipv4-secondary"]),
                                 default="N/A",
                             )
                         }
                     }
-                ipv6_address = self._find_txt(
-                    interface,
-                    "configure_ns:ipv6/configure_ns:address/configure_ns:ipv6-address",
-                    namespaces=self.nsmap,
-                )
+                ipv6_address = self._find_txt(interface, _XP_CONF_IP_ADDRESS["ipv6"])
                 if ipv6_address != "":
                     interfaces_ip[interface_name]["ipv6"] = {
                         ipv6_address: {
                             "prefix_length": convert(
                                 int,
-                                self._find_txt(
-                                    interface,
-                                    "configure_ns:ipv6/configure_ns:address/configure_ns:prefix-length",
-                                    namespaces=self.nsmap,
-                                ),
+                                self._find_txt(interface, _XP_CONF_PREFIX_LENGTH["ipv6"]),
                                 default="N/A",
                             )
                         }
@@ -1522,11 +1685,9 @@ class NokiaSROSDriver(NetworkDriver):
         """
         try:
             ntp_peers = {}
-            result = to_ele(
-                self.conn.get(
-                    filter=GET_NTP_PEERS["_"], with_defaults="report-all"
-                ).data_xml
-            )
+            result = self.conn.get(
+                filter=GET_NTP_PEERS["_"], with_defaults="report-all"
+            ).data_ele
 
             for peer in result.xpath(
                 "state_ns:state/state_ns:system/state_ns:time/state_ns:ntp/state_ns:peer",
@@ -1554,11 +1715,9 @@ class NokiaSROSDriver(NetworkDriver):
         """
         try:
             ntp_servers = {}
-            result = to_ele(
-                self.conn.get(
-                    filter=GET_NTP_SERVERS["_"], with_defaults="report-all"
-                ).data_xml
-            )
+            result = self.conn.get(
+                filter=GET_NTP_SERVERS["_"], with_defaults="report-all"
+            ).data_ele
 
             for server in result.xpath(
                 "state_ns:state/state_ns:system/state_ns:time/state_ns:ntp/state_ns:server",
@@ -1610,7 +1769,7 @@ class NokiaSROSDriver(NetworkDriver):
                         if len(row_list) == 8:
                             temp_dict = {
                                 "referenceid": row_list[1],
-                                "synchronized": True if row_list[0] == "chosen" else False,
+                                "synchronized": row_list[0] == "chosen",
                                 "stratum": convert(int, row_list[2]),
                                 "type": row_list[3],
                                 "hostpoll": convert(int, row_list[5]),
@@ -1657,11 +1816,9 @@ class NokiaSROSDriver(NetworkDriver):
         """
         try:
             snmp_information = {}
-            result = to_ele(
-                self.conn.get(
-                    filter=GET_SNMP_INFORMATION["_"], with_defaults="report-all"
-                ).data_xml
-            )
+            result = self.conn.get(
+                filter=GET_SNMP_INFORMATION["_"], with_defaults="report-all"
+            ).data_ele
 
             for system in result.xpath(
                 "configure_ns:configure/configure_ns:system", namespaces=self.nsmap
@@ -1686,9 +1843,7 @@ class NokiaSROSDriver(NetworkDriver):
                     )
                     if community_string == "":
                         continue
-                    if community_string not in snmp_information["community"].keys():
-                        snmp_information["community"].update({community_string: {}})
-                    snmp_information["community"][community_string].update(
+                    snmp_information["community"].setdefault(community_string, {}).update(
                         {
                             "acl": self._find_txt(
                                 community,
@@ -1722,9 +1877,7 @@ class NokiaSROSDriver(NetworkDriver):
         try:
             users_dict = {}
             profile_dict = {}
-            result = to_ele(
-                self.conn.get(filter=GET_USERS["_"], with_defaults="report-all").data_xml
-            )
+            result = self.conn.get(filter=GET_USERS["_"], with_defaults="report-all").data_ele
 
             for profile in result.xpath(
                 "configure_ns:configure/configure_ns:system/configure_ns:security/configure_ns:aaa/configure_ns:local-profiles/configure_ns:profile",
@@ -1813,7 +1966,7 @@ class NokiaSROSDriver(NetworkDriver):
         try:
             route_to_dict = {}
 
-            def _get_protocol_attributes(router_name, local_protocol):
+            def _get_protocol_attributes(router_routes, router_name, local_protocol):
                 # destination needs to be with prefix
                 command = f"/show router {router_name} route-table {destination} protocol {local_protocol} extensive all"
                 output = self._perform_cli_commands([command], True, no_more=True)
@@ -1822,205 +1975,156 @@ class NokiaSROSDriver(NetworkDriver):
                 next_hop = ""
                 age = ""
                 preference = ""
+                # routes of the current destination, indexed by their next-hop
+                nh_index = {}
+
+                def _set_next_hop_all(new_next_hop, selected_next_hop):
+                    for d in router_routes[destination_address_with_prefix]:
+                        d["next_hop"] = new_next_hop
+                        d["selected_next_hop"] = selected_next_hop
+                    nh_index.clear()
+                    nh_index[new_next_hop] = list(router_routes[destination_address_with_prefix])
+
                 for item_1 in re.split("\n|\r", output):
                     if "Dest Prefix" in item_1:
                         row_1 = item_1.strip()
-                        row_1_list = row_1.split(": ")
-                        destination_address_with_prefix = row_1_list[1]
-                        route_to_dict.update(
+                        _, _, value = row_1.partition(": ")
+                        destination_address_with_prefix = value
+                        nh_index.clear()
+                        router_routes.update(
                             {
-                                row_1_list[1]: [
+                                value: [
                                     {
                                         "routing_table": router_name,
                                         "protocol": local_protocol,
                                         "last_active": False,
                                         "inactive_reason": "",
+                                        "protocol_attributes": {},
                                     }
                                 ]
                             }
                         )
                     elif "Age" in item_1:
                         row_1 = item_1.strip()
-                        row_1_list = row_1.split(": ")
-                        if "d" in row_1_list[1]:
-                            time_string = re.split("d|h|m", row_1_list[1])
-                        else:
-                            time_string = re.split("h|m|s", row_1_list[1])
-                        age = (
-                            (int(time_string[0]) * 86400)
-                            + (int(time_string[1]) * 60 * 60)
-                            + (int(time_string[2]) * 60)
-                        )
-                        for d in route_to_dict[destination_address_with_prefix]:
-                            d.update({"age": age})
+                        _, _, value = row_1.partition(": ")
+                        age = _route_age(value)
+                        for d in router_routes[destination_address_with_prefix]:
+                            d["age"] = age
                     elif "Preference" in item_1:
                         row_1 = item_1.strip()
-                        row_1_list = row_1.split(": ")
-                        preference = row_1_list[1]
-                        for d in route_to_dict[destination_address_with_prefix]:
-                            d.update({"preference": convert(int, preference, default=-1)})
+                        _, _, value = row_1.partition(": ")
+                        preference = value
+                        preference_int = convert(int, preference, default=-1)
+                        for d in router_routes[destination_address_with_prefix]:
+                            d["preference"] = preference_int
                     elif "Active" in item_1:
                         row_1 = item_1.strip()
-                        row_1_list = row_1.split(": ")
-                        for d in route_to_dict[destination_address_with_prefix]:
-                            if next_hop_once:
-                                if d.get("next_hop") == next_hop:
-                                    d.update(
-                                        {
-                                            "current_active": True
-                                            if row_1_list[1] is True
-                                            else False
-                                        }
-                                    )
-                            else:
-                                d.update(
-                                    {
-                                        "current_active": True
-                                        if row_1_list[1] is True
-                                        else False
-                                    }
-                                )
+                        _, _, value = row_1.partition(": ")
+                        if next_hop_once:
+                            routes = nh_index.get(next_hop, ())
+                        else:
+                            routes = router_routes[destination_address_with_prefix]
+                        for d in routes:
+                            d["current_active"] = value is True
                     elif "Next-Hop" in item_1:
                         row_1 = item_1.strip()
-                        row_1_list = row_1.split(": ")
-                        _sel = self.ipv4_address_re.search(row_1_list[1])
-                        temp_2_dict = {"selected_next_hop": bool(_sel)}
+                        _, _, value = row_1.partition(": ")
+                        # the value is the bare next-hop, a dotted quad means an IPv4 address
+                        selected_next_hop = value[:1].isdigit() and value.count(".") == 3
                         if "Indirect" in item_1:
                             if next_hop_once:
-                                next_hop = row_1_list[1]
-                                route_to_dict[destination_address_with_prefix].append(
-                                    {
-                                        "routing_table": router_name,
-                                        "protocol": protocol,
-                                        "next_hop": row_1_list[1],
-                                        "age": age,
-                                        "preference": convert(int, preference, default=-1),
-                                        "last_active": False,  # default value as SROS does not have this value
-                                        "inactive_reason": "",
-                                    }
-                                )
-                                for d in route_to_dict[destination_address_with_prefix]:
-                                    if d.get("next_hop") == next_hop:
-                                        d.update(temp_2_dict)
+                                next_hop = value
+                                new_route = {
+                                    "routing_table": router_name,
+                                    "protocol": protocol,
+                                    "next_hop": value,
+                                    "age": age,
+                                    "preference": convert(int, preference, default=-1),
+                                    "last_active": False,  # default value as SROS does not have this value
+                                    "inactive_reason": "",
+                                    "protocol_attributes": {},
+                                }
+                                router_routes[destination_address_with_prefix].append(new_route)
+                                nh_index.setdefault(next_hop, []).append(new_route)
+                                for d in nh_index[next_hop]:
+                                    d["selected_next_hop"] = selected_next_hop
                             else:
-                                for d in route_to_dict[destination_address_with_prefix]:
-                                    d.update({"next_hop": row_1_list[1]})
-                                    d.update(temp_2_dict)
+                                _set_next_hop_all(value, selected_next_hop)
                                 next_hop_once = True
-                                next_hop = row_1_list[1]
+                                next_hop = value
                         elif "Resolving" in item_1:
-                            for d in route_to_dict[destination_address_with_prefix]:
-                                if d.get("next_hop") == next_hop:
-                                    d.update(temp_2_dict)
-                                    d.update({"next_hop": row_1_list[1]})
-                            next_hop = row_1_list[1]
+                            resolved = nh_index.pop(next_hop, [])
+                            for d in resolved:
+                                d["selected_next_hop"] = selected_next_hop
+                                d["next_hop"] = value
+                            next_hop = value
+                            nh_index.setdefault(next_hop, []).extend(resolved)
                         else:
-                            for d in route_to_dict[destination_address_with_prefix]:
-                                d.update({"next_hop": row_1_list[1]})
-                                d.update(temp_2_dict)
+                            _set_next_hop_all(value, selected_next_hop)
                             next_hop_once = True
-                            next_hop = row_1_list[1]
+                            next_hop = value
                     elif "Interface" in item_1:
                         row_1 = item_1.strip()
-                        row_1_list = row_1.split(": ")
-                        for d in route_to_dict[destination_address_with_prefix]:
-                            if d.get("next_hop") == next_hop:
-                                d.update({"outgoing_interface": row_1_list[1]})
+                        _, _, value = row_1.partition(": ")
+                        for d in nh_index.get(next_hop, ()):
+                            d["outgoing_interface"] = value
                     elif "Metric" in item_1:
                         if local_protocol == "bgp":
                             row_1 = item_1.strip()
-                            row_1_list = row_1.split(": ")
-                            for d in route_to_dict[destination_address_with_prefix]:
-                                if d.get("next_hop") == next_hop:
-                                    # Update BGP protocol attributes dictionary
-                                    d.update(
-                                        {
-                                            "protocol_attributes": {
-                                                "metric": convert(
-                                                    int, row_1_list[1], default=-1
-                                                ),
-                                                "metric2": -1,  # default value as SROS does not have this
-                                                "preference2": convert(
-                                                    int, preference, default=-1
-                                                ),
-                                            }
-                                        }
-                                    )
+                            _, _, value = row_1.partition(": ")
+                            for d in nh_index.get(next_hop, ()):
+                                # Update BGP protocol attributes dictionary
+                                d["protocol_attributes"] = {
+                                    "metric": convert(int, value, default=-1),
+                                    "metric2": -1,  # default value as SROS does not have this
+                                    "preference2": convert(int, preference, default=-1),
+                                }
+                return destination_address_with_prefix
 
             # Method for extracting BGP protocol attributes from router
-            def _get_bgp_protocol_attributes(router_name):
-                destination_address_with_prefix = ""
-
-                for k, v in route_to_dict.items():
-                    destination_address_with_prefix = k
+            def _get_bgp_protocol_attributes(
+                router_routes, router_name, destination_address_with_prefix
+            ):
                 if destination_address_with_prefix:
                     # protocol attributes local_as, as_path, local_preference
                     cmd = f"/show router {router_name} bgp routes {destination_address_with_prefix} detail"
                     buff_1 = self._perform_cli_commands( [cmd], True, no_more=True )
 
-                    for d in route_to_dict[destination_address_with_prefix]:
+                    for d in router_routes[destination_address_with_prefix]:
                         next_hop = d.get("next_hop")
 
                         # protocol attributes peer_id and remote_as
-                        match_router = False
-                        for bgp_neighbor in result.xpath(
-                            "state_ns:state/state_ns:router/state_ns:bgp/state_ns:neighbor",
-                            namespaces=self.nsmap,
-                        ):
-                            ip_address = self._find_txt(
-                                bgp_neighbor, "state_ns:ip-address", namespaces=self.nsmap
+                        bgp_neighbor = bgp_peer_by_ip.get(next_hop)
+                        if bgp_neighbor is not None:
+                            d["protocol_attributes"].update(
+                                {
+                                    "peer_id": self._find_txt(
+                                        bgp_neighbor, _XP_PEER_IDENTIFIER
+                                    ),
+                                    "remote_as": convert(
+                                        int,
+                                        self._find_txt(bgp_neighbor, _XP_PEER_AS),
+                                        default=-1,
+                                    ),
+                                }
                             )
-                            if ip_address == next_hop:
-                                match_router = True
-                                d["protocol_attributes"].update(
-                                    {
-                                        "peer_id": self._find_txt(
-                                            bgp_neighbor,
-                                            "state_ns:statistics/state_ns:peer-identifier",
-                                            namespaces=self.nsmap,
-                                        ),
-                                        "remote_as": convert(
-                                            int,
-                                            self._find_txt(
-                                                bgp_neighbor,
-                                                "state_ns:statistics/state_ns:peer-as",
-                                                namespaces=self.nsmap,
-                                            ),
-                                            default=-1,
-                                        ),
-                                    }
-                                )
-                                # update bgp protocol for protocol attributes local_as, as_path, local_preference
-                                _update_bgp_protocol_attributes(buff_1, d)
-                                break
-                        if not match_router:
-                            for vprn_bgp_neighbor in result.xpath(
-                                "state_ns:state/state_ns:service/state_ns:vprn/state_ns:bgp/state_ns:neighbor",
-                                namespaces=self.nsmap,
-                            ):
-                                ip_address = self._find_txt(
-                                    vprn_bgp_neighbor,
-                                    "state_ns:ip-address",
-                                    namespaces=self.nsmap,
-                                )
-                                if ip_address == next_hop:
-                                    d["protocol_attributes"].update(
-                                        {
-                                            "peer_id": self._find_txt(
-                                                vprn_bgp_neighbor,
-                                                "state_ns:statistics/state_ns:peer-identifier",
-                                                namespaces=self.nsmap,
-                                            ),
-                                            "remote_as": self._find_txt(
-                                                vprn_bgp_neighbor,
-                                                "state_ns:statistics/state_ns:peer-as",
-                                                namespaces=self.nsmap,
-                                            ),
-                                        }
-                                    )
-                                    # update bgp protocol for protocol attributes local_as, as_path, local_preference
-                                    _update_bgp_protocol_attributes(buff_1, d)
-                                    break
+                            # update bgp protocol for protocol attributes local_as, as_path, local_preference
+                            _update_bgp_protocol_attributes(buff_1, d)
+                            continue
+                        vprn_bgp_neighbor = vprn_peer_by_ip.get(next_hop)
+                        if vprn_bgp_neighbor is not None:
+                            d["protocol_attributes"].update(
+                                {
+                                    "peer_id": self._find_txt(
+                                        vprn_bgp_neighbor, _XP_PEER_IDENTIFIER
+                                    ),
+                                    "remote_as": self._find_txt(
+                                        vprn_bgp_neighbor, _XP_PEER_AS
+                                    ),
+                                }
+                            )
+                            # update bgp protocol for protocol attributes local_as, as_path, local_preference
+                            _update_bgp_protocol_attributes(buff_1, d)
 
             def _update_bgp_protocol_attributes(buff_1, d):
                 modified_attributes = False
@@ -2029,44 +2133,36 @@ class NokiaSROSDriver(NetworkDriver):
                         modified_attributes = True
                         continue
                     if "Local AS" in item_1:
-                        row_1 = item_1.strip()
-                        row_1_list = row_1.split(":")
-                        d["protocol_attributes"].update(
-                            {"local_as": convert(int, row_1_list[3], default=-1)}
+                        m = _LOCAL_AS_RE.search(item_1)
+                        d["protocol_attributes"]["local_as"] = convert(
+                            int, m and m.group(1), default=-1
                         )
                     elif "AS-Path" in item_1 and modified_attributes:
                         row_1 = item_1.strip()
-                        row_1_list = row_1.split(": ")
-                        d["protocol_attributes"].update({"as_path": row_1_list[1]})
+                        _, _, value = row_1.partition(": ")
+                        d["protocol_attributes"]["as_path"] = value
                         modified_attributes = False
                     elif "Local Pref." in item_1 and modified_attributes:
-                        row_1 = item_1.strip()
-                        row_1_list = row_1.split(": ")
-                        d["protocol_attributes"].update(
-                            {
-                                "local_preference": convert(
-                                    int, row_1_list[1].split(" ")[0], default=-1
-                                )
-                            }
+                        m = _LOCAL_PREF_RE.search(item_1)
+                        d["protocol_attributes"]["local_preference"] = convert(
+                            int, m and m.group(1), default=-1
                         )
                     elif "Community" in item_1 and modified_attributes:
                         row_1 = item_1.strip()
-                        row_1_list = row_1.split(": ")
-                        multiple_community = row_1_list[1].split(" ")
-                        d["protocol_attributes"].update({"communities": multiple_community})
+                        _, _, value = row_1.partition(": ")
+                        multiple_community = value.split(" ")
+                        d["protocol_attributes"]["communities"] = multiple_community
 
             # Method for extracting ISIS protocol attributes from router
-            def _get_isis_protocol_attributes(router_name):
-                destination_address_with_prefix = ""
-                for k, v in route_to_dict.items():
-                    destination_address_with_prefix = k
+            def _get_isis_protocol_attributes(
+                router_routes, router_name, destination_address_with_prefix
+            ):
                 if destination_address_with_prefix:
-                    for d in route_to_dict[destination_address_with_prefix]:
-                        d.update({"protocol_attributes": {}})
                     command = f"/show router {router_name} isis routes ip-prefix-prefix-length {destination_address_with_prefix}"
                     buff_1 = self._perform_cli_commands([command], True, no_more=True)
                     prev_row = ""
-                    for item_1 in buff_1.split("\n"):
+                    routes = router_routes[destination_address_with_prefix]
+                    for item_1 in buff_1.splitlines():
                         if destination_address_with_prefix in item_1 or prev_row:
                             if "# show" in item_1:
                                 continue
@@ -2078,24 +2174,20 @@ class NokiaSROSDriver(NetworkDriver):
                             else:
                                 next_hop = row_1_list[0]
                                 prev_row = ""
-                                for d in route_to_dict[destination_address_with_prefix]:
+                                for d in routes:
                                     if d.get("next_hop") == next_hop:
-                                        d["protocol_attributes"].update(
-                                            {"level": temp_list[0]}
-                                        )
+                                        d["protocol_attributes"]["level"] = temp_list[0]
 
             # Method for extracting OSPF protocol attributes from router
-            def _get_ospf_protocol_attributes(router_name):
-                destination_address_with_prefix = ""
-                for k, v in route_to_dict.items():
-                    destination_address_with_prefix = k
+            def _get_ospf_protocol_attributes(
+                router_routes, router_name, destination_address_with_prefix
+            ):
                 if destination_address_with_prefix:
-                    for d in route_to_dict[destination_address_with_prefix]:
-                        d.update({"protocol_attributes": {}})
                     command = f"/show router {router_name} ospf routes {destination_address_with_prefix}"
                     buff_1 = self._perform_cli_commands([command], True, no_more=True)
                     first_row = False
-                    for item_1 in buff_1.split("\n"):
+                    routes = router_routes[destination_address_with_prefix]
+                    for item_1 in buff_1.splitlines():
                         if destination_address_with_prefix in item_1 or first_row:
                             if "# show" in item_1:
                                 continue
@@ -2106,29 +2198,40 @@ class NokiaSROSDriver(NetworkDriver):
                             row_1_list = row_1.split()
                             next_hop = row_1_list[0]
                             first_row = False
-                            for d in route_to_dict[destination_address_with_prefix]:
+                            for d in routes:
                                 if d.get("next_hop") == next_hop:
-                                    d["protocol_attributes"].update({"cost": row_1_list[2]})
+                                    d["protocol_attributes"]["cost"] = row_1_list[2]
 
-            result = to_ele(
-                self.conn.get(filter=GET_ROUTE_TO["_"], with_defaults="report-all").data_xml
-            )
+            # data_ele is the <data> element ncclient already parsed, no need to
+            # serialize it to data_xml and parse it again
+            result = self.conn.get(
+                filter=GET_ROUTE_TO["_"], with_defaults="report-all"
+            ).data_ele
 
-            name_list = []
-            for router in result.xpath(
-                "state_ns:state/state_ns:router", namespaces=self.nsmap
-            ):
-                name_list.append(
-                    self._find_txt(router, "state_ns:router-name", namespaces=self.nsmap)
+            # BGP peers by address, the first neighbor listed for an address wins
+            bgp_peer_by_ip = {}
+            for bgp_neighbor in _XP_ROUTER_BGP_NEIGHBOR(result):
+                bgp_peer_by_ip.setdefault(
+                    self._find_txt(bgp_neighbor, _XP_IP_ADDRESS), bgp_neighbor
                 )
-            for vprn in result.xpath(
-                "state_ns:state/state_ns:service/state_ns:vprn", namespaces=self.nsmap
-            ):
-                name_list.append(
-                    self._find_txt(vprn, "state_ns:oper-service-id", namespaces=self.nsmap)
+            vprn_peer_by_ip = {}
+            for vprn_bgp_neighbor in _XP_VPRN_BGP_NEIGHBOR(result):
+                vprn_peer_by_ip.setdefault(
+                    self._find_txt(vprn_bgp_neighbor, _XP_IP_ADDRESS), vprn_bgp_neighbor
                 )
 
+            name_list = [
+                names[0] if names else ""
+                for names in map(_XP_ROUTER_NAME, _XP_ROUTER(result))
+            ]
+            name_list.extend(
+                ids[0] if ids else ""
+                for ids in map(_XP_VPRN_SERVICE_ID, _XP_VPRN(result))
+            )
+
             for name in name_list:
+                # routes of this routing instance, merged into route_to_dict afterwards
+                router_routes = {}
 
                 bgp_once = False
                 isis_once = False
@@ -2146,42 +2249,59 @@ class NokiaSROSDriver(NetworkDriver):
                     cmd = f"/show router {name} route-table {destination} \n"
 
                 buff = self._perform_cli_commands([cmd], True, no_more=True)
-                for item in buff.split("\n"):
-                    if self.ipv4_address_re.search(item):
+                for item in buff.splitlines():
+                    row = item.strip()
+                    # route entries start with the prefix, reject headers before the regex
+                    if row[:1].isdigit() and self.ipv4_address_re.match(row):
                         if "# show" in item:
                             continue
-                        row = item.strip()
                         row_list = row.split()
                         if len(row_list) > 2:
                             local_protocol = row_list[2].lower()
                             if local_protocol == "bgp":
                                 if not bgp_once:
-                                    _get_protocol_attributes(name, local_protocol)
+                                    dest = _get_protocol_attributes(router_routes, name, local_protocol)
                                     bgp_once = True
-                                    _get_bgp_protocol_attributes(name)
+                                    _get_bgp_protocol_attributes(router_routes, name, dest)
                             if local_protocol == "isis":
                                 if not isis_once:
-                                    _get_protocol_attributes(name, local_protocol)
+                                    dest = _get_protocol_attributes(router_routes, name, local_protocol)
                                     isis_once = True
-                                    _get_isis_protocol_attributes(name)
+                                    _get_isis_protocol_attributes(router_routes, name, dest)
                             elif local_protocol == "local":
                                 if not local_once:
-                                    _get_protocol_attributes(name, local_protocol)
+                                    _get_protocol_attributes(router_routes, name, local_protocol)
                                     local_once = True
                             elif local_protocol == "ospf":
                                 if not ospf_once:
-                                    _get_protocol_attributes(name, local_protocol)
+                                    dest = _get_protocol_attributes(router_routes, name, local_protocol)
                                     ospf_once = True
-                                    _get_ospf_protocol_attributes(name)
+                                    _get_ospf_protocol_attributes(router_routes, name, dest)
                             elif local_protocol == "static":
                                 if not static_once:
-                                    _get_protocol_attributes(name, local_protocol)
+                                    _get_protocol_attributes(router_routes, name, local_protocol)
                                     static_once = True
+                for prefix, routes in router_routes.items():
+                    route_to_dict.setdefault(prefix, []).extend(routes)
             return route_to_dict
         except Exception as e:
             print("Error in method get route to : {}".format(e))
             log.error("Error in method get route to : %s" % traceback.format_exc())
 
+    def _get_probes_cfg_etree(self):
+        """
+        Returns the parsed SAA configuration used by get_probes_results and get_probes_config.
+        The reply is reused for up to cache_ttl seconds, so calling both getters back to back
+        costs a single NETCONF get.
+        """
+        now = time.monotonic()
+        if self._probes_cfg_etree is None or now - self._probes_cfg_ts >= self.cache_ttl:
+            self._probes_cfg_etree = self.conn.get(
+                filter=GET_PROBES_CONFIG["_"], with_defaults="report-all"
+            ).data_ele
+            self._probes_cfg_ts = now
+        return self._probes_cfg_etree
+
     def get_probes_results(self):
         # for base router
         """
@@ -2208,35 +2328,23 @@ class NokiaSROSDriver(NetworkDriver):
         try:
             probes_results = {}
 
-            result = to_ele(
-                self.conn.get(
-                    filter=GET_PROBES_CONFIG["_"], with_defaults="report-all"
-                ).data_xml,
-            )
-            for probe in result.xpath(
-                "configure_ns:configure/configure_ns:saa/configure_ns:owner",
-                namespaces=self.nsmap,
-            ):
-                probe_name = self._find_txt(
-                    probe, "configure_ns:owner-name", namespaces=self.nsmap
-                )
+            result = self._get_probes_cfg_etree()
+            for probe in _XP_SAA_OWNER(result):
+                probe_name = self._find_txt(probe, _XP_SAA_OWNER_NAME)
                 if probe_name == "":
                     continue
-                test_name = self._find_txt(
-                    probe, "configure_ns:test", namespaces=self.nsmap
-                )
+                test_name = self._find_txt(probe, _XP_SAA_TEST)
                 if test_name == "":
                     continue
-                if probe_name not in probes_results.keys():
+                if probe_name not in probes_results:
                     probes_results.update({probe_name: {}})
                 probes_results[probe_name].update({test_name: {}})
-                path = "configure_ns:type/configure_ns:icmp-ping"
                 cmd = f"/show saa {test_name}"
                 buff = self._perform_cli_commands([cmd], True, no_more=True)
-                test_number_1 = ""
-                test_number_2 = 0
-                found_first_test = False
-                found_second_test = False
+                test_runs = 0
+                test_run = 0
+                total_number_of_attempts = 0
+                last_test_loss = ""
                 last_test_min_delay = ""
                 last_test_max_delay = ""
                 last_test_avg_delay = ""
@@ -2244,71 +2352,45 @@ class NokiaSROSDriver(NetworkDriver):
                 current_test_max_delay = ""
                 current_test_avg_delay = ""
                 roundtrip_jitter = ""
-                for item in buff.split("\n"):
-                    if "Test runs since last clear" in item:
-                        row = item.strip()
-                        row_list = row.split(": ")
-                        if int(row_list[1]) > 0:
-                            test_number_1 = row_list[1]
-                            test_number_2 = int(test_number_1) - 1
-                            continue
-                        else:
+                # current test is the last run, last test is the run before it
+                for match in _SAA_RESULTS_RE.finditer(buff):
+                    field = match.lastgroup
+                    if field == "runs":
+                        test_runs = int(match.group("runs"))
+                        if test_runs == 0:
                             break
-                    if test_number_2 > 0:
-                        if str(test_number_2) in item:
-                            found_second_test = True
-                            total_number_of_attempts = 0
-                        if found_second_test:
-                            if "Total number of attempts" in item:
-                                row_1 = item.strip()
-                                row_1_list = row_1.split(": ")
-                                total_number_of_attempts = int(row_1_list[1])
-                            elif "failed to be sent out" in item:
-                                row_1 = item.strip()
-                                row_1_list = row_1.split(": ")
-                                requests_failed_to_be_sent_out = int(row_1_list[1])
-                                if total_number_of_attempts > 0:
-                                    last_test_loss = float(
-                                        requests_failed_to_be_sent_out
-                                        / total_number_of_attempts
-                                    )
-                            if "Roundtrip" in item:
-                                test_number_2 = 0
-                                row_1 = item.strip()
-                                row_1_list = row_1.split()
-                                last_test_min_delay = float(row_1_list[2])
-                                last_test_max_delay = row_1_list[3]
-                                last_test_avg_delay = row_1_list[4]
-
-                    if test_number_1:
-                        if test_number_1 in item:
-                            found_first_test = True
-                        if found_first_test:
-                            if "Roundtrip" in item:
-                                row_1 = item.strip()
-                                row_1_list = row_1.split()
-                                roundtrip_jitter = row_1_list[5]
-                                current_test_avg_delay = row_1_list[4]
-                                current_test_max_delay = row_1_list[3]
-                                current_test_min_delay = row_1_list[2]
+                    elif test_runs == 0:
+                        continue
+                    elif field == "run":
+                        test_run = int(match.group("run"))
+                        total_number_of_attempts = 0
+                    elif test_run == test_runs - 1:
+                        if field == "attempts":
+                            total_number_of_attempts = int(match.group("attempts"))
+                        elif field == "failed":
+                            requests_failed_to_be_sent_out = int(match.group("failed"))
+                            if total_number_of_attempts > 0:
+                                last_test_loss = float(
+                                    requests_failed_to_be_sent_out
+                                    / total_number_of_attempts
+                                )
+                        elif field == "jitter":
+                            last_test_min_delay = match.group("min")
+                            last_test_max_delay = match.group("max")
+                            last_test_avg_delay = match.group("avg")
+                    elif test_run == test_runs and field == "jitter":
+                        roundtrip_jitter = match.group("jitter")
+                        current_test_avg_delay = match.group("avg")
+                        current_test_max_delay = match.group("max")
+                        current_test_min_delay = match.group("min")
                 probes_results[probe_name][test_name].update(
                     {
                         "probe_type": "icmp-ping",
-                        "target": self._find_txt(
-                            probe,
-                            f"{path}/configure_ns:destination-address",
-                            namespaces=self.nsmap,
-                        ),
-                        "source": self._find_txt(
-                            probe,
-                            f"{path}/configure_ns:source-address",
-                            namespaces=self.nsmap,
-                        ),
+                        "target": self._find_txt(probe, _XP_SAA_ICMP_DESTINATION),
+                        "source": self._find_txt(probe, _XP_SAA_ICMP_SOURCE),
                         "probe_count": convert(
                             int,
-                            self._find_txt(
-                                probe, f"{path}/configure_ns:count", namespaces=self.nsmap,
-                            ),
+                            self._find_txt(probe, _XP_SAA_ICMP_COUNT),
                         ),
                         "rtt": convert(float, current_test_avg_delay, default=-1.0),
                         "round_trip_jitter": convert(float, roundtrip_jitter, default=-1.0),
@@ -2359,58 +2441,32 @@ class NokiaSROSDriver(NetworkDriver):
         try:
             probes_config = {}
 
-            result = to_ele(
-                self.conn.get(
-                    filter=GET_PROBES_CONFIG["_"], with_defaults="report-all"
-                ).data_xml
-            )
+            result = self._get_probes_cfg_etree()
 
-            for probe in result.xpath(
-                "configure_ns:configure/configure_ns:saa/configure_ns:owner",
-                namespaces=self.nsmap,
-            ):
-                probe_name = self._find_txt(
-                    probe, "configure_ns:owner-name", namespaces=self.nsmap
-                )
+            for probe in _XP_SAA_OWNER(result):
+                probe_name = self._find_txt(probe, _XP_SAA_OWNER_NAME)
                 if probe_name == "":
                     continue
-                test_name = self._find_txt(
-                    probe, "configure_ns:test", namespaces=self.nsmap
-                )
+                test_name = self._find_txt(probe, _XP_SAA_TEST)
                 if test_name == "":
                     continue
-                path = "configure_ns:type/configure_ns:icmp-ping"
-                if probe_name not in probes_config.keys():
-                    probes_config = {probe_name: {test_name: {}}}
+                if probe_name not in probes_config:
+                    probes_config[probe_name] = {test_name: {}}
                 else:
                     probes_config[probe_name].update({test_name: {}})
                 probes_config[probe_name][test_name].update(
                     {
                         "probe_type": "icmp-ping",
-                        "target": self._find_txt(
-                            probe,
-                            f"{path}/configure_ns:destination-address",
-                            namespaces=self.nsmap,
-                        ),
-                        "source": self._find_txt(
-                            probe,
-                            f"{path}/configure_ns:source-address",
-                            namespaces=self.nsmap,
-                        ),
+                        "target": self._find_txt(probe, _XP_SAA_ICMP_DESTINATION),
+                        "source": self._find_txt(probe, _XP_SAA_ICMP_SOURCE),
                         "probe_count": convert(
                             int,
-                            self._find_txt(
-                                probe, f"{path}/configure_ns:count", namespaces=self.nsmap,
-                            ),
+                            self._find_txt(probe, _XP_SAA_ICMP_COUNT),
                             default=-1,
                         ),
                         "test_interval": convert(
                             int,
-                            self._find_txt(
-                                probe,
-                                f"{path}/configure_ns:interval",
-                                namespaces=self.nsmap,
-                            ),
+                            self._find_txt(probe, _XP_SAA_ICMP_INTERVAL),
                             default=-1,
                         ),
                     }
@@ -2438,38 +2494,42 @@ class NokiaSROSDriver(NetworkDriver):
 
             cmd = "/show service fdb-mac"
             buff = self._perform_cli_commands([cmd], True, no_more=True)
-            template = "textfsm_templates//nokia_sros_show_service_fdb_mac.tpl"
-            # template = "textfsm_templates\\nokia_sros_show_service_fdb_mac.tpl"
-            output_list = parse_with_textfsm(template, buff)
+            output_list = parse_with_textfsm(_FDB_MAC_TEMPLATE, buff)
+            # continuation columns ("Type__") are appended to their base column ("Type"),
+            # all records share the template header so the mapping is built once
+            continuation = {
+                k: k.replace("__", "") for k in (output_list[0] if output_list else ()) if k.endswith("_")
+            }
             new_records = []
             for record in output_list:
                 new_dict = {}
                 for k, v in record.items():
-                    if k.endswith("_"):
-                        new_dict[k.replace("__", "")] = new_dict[k.replace("__", "")] + v
-                    else:
+                    base = continuation.get(k)
+                    if base is None:
                         new_dict[k] = v
+                    else:
+                        new_dict[base] += v
                 new_records.append(new_dict)
 
             for record in new_records:
                 source_identifier = record.get("Source_Identifier")
-                temp_list = []
+                interface = source_identifier
+                vlan = -1
                 if ":" in source_identifier:
+                    # sap:<port>:<vlan>
                     temp_list = source_identifier.split(":")
-                static = False
-                if (
-                    record.get("Type").lower().find("static") > -1
-                    or record.get("Type").find("S") > -1
-                ):
-                    static = True
+                    interface = temp_list[0] + ":" + temp_list[1]
+                    if len(temp_list) > 2:
+                        vlan = convert(int, temp_list[2])
+                # the cheap "S" flag check usually decides before lower() is needed
+                fdb_type = record.get("Type", "")
+                static = "S" in fdb_type or "static" in fdb_type.lower()
 
                 mac_address_list.append(
                     {
                         "mac": record.get("MAC"),
-                        "interface": source_identifier
-                        if len(temp_list) == 0
-                        else temp_list[0] + ":" + temp_list[1],
-                        "vlan": -1 if len(temp_list) == 0 else convert(int, temp_list[2]),
+                        "interface": interface,
+                        "vlan": vlan,
                         "static": static,
                         "active": False,
                         "moves": -1,
@@ -2482,6 +2542,20 @@ class NokiaSROSDriver(NetworkDriver):
             print("Error in method get mac address : {}".format(e))
             log.error("Error in method get mac address : %s" % traceback.format_exc())
 
+    def _get_bgp_etree(self):
+        """
+        Returns the parsed BGP configuration and the state of all neighbors, covering
+        get_bgp_neighbors, get_bgp_neighbors_detail and get_bgp_config. The reply is
+        reused for up to cache_ttl seconds.
+        """
+        now = time.monotonic()
+        if self._bgp_etree is None or now - self._bgp_ts >= self.cache_ttl:
+            self._bgp_etree = self.conn.get(
+                filter=_GET_BGP_ALL, with_defaults="report-all"
+            ).data_ele
+            self._bgp_ts = now
+        return self._bgp_etree
+
     def get_bgp_neighbors(self):
         """
             Returns a dictionary of dictionaries. The keys for the first dictionary will be the vrf
@@ -2507,6 +2581,8 @@ class NokiaSROSDriver(NetworkDriver):
                 uptime of the last active BGP session.
         """
         try:
+          if self.cache_ttl:
+            return get_bgp_neighbors(self.conn, data=self._get_bgp_etree())
           return get_bgp_neighbors(self.conn)
         except Exception as e:
           print(e)
@@ -2558,6 +2634,10 @@ class NokiaSROSDriver(NetworkDriver):
 
         """
         try:
+          if self.cache_ttl:
+            return get_bgp_neighbors_detail(
+                self.conn, neighbor_address, data=self._get_bgp_etree()
+            )
           return get_bgp_neighbors_detail(self.conn,neighbor_address)
         except Exception as e:
           print(e)
@@ -2618,94 +2698,71 @@ class NokiaSROSDriver(NetworkDriver):
         # Does not (cannot) report dynamic neighbors, only static ones
         #
         try:
-            bgp_config = {}
-
             # helpers
 
-            def _build_prefix_limit(peer_xml):
+            def _ft(xml, path):
+                # ElementPath lookup for plain child paths, lighter than XPath;
+                # the paths that step up with '..' use string(...) XPaths instead
+                return xml.findtext(path, default="").strip()
+
+            # The Clark prefix and the module-level helpers are bound as default
+            # arguments, local lookups in the loops
+            def _build_prefix_limit(peer_xml, conf=_CONF):
                 prefix_limit = {}
-                for pl in peer_xml.xpath(
-                    "configure_ns:prefix-limit", namespaces=self.nsmap
-                ):
-                    af = self._find_txt(
-                        pl, "configure_ns:family", namespaces=self.nsmap
-                    ).lower()
+                for pl in peer_xml.findall(f"{conf}prefix-limit"):
+                    # one pass over the leaves instead of a search for each of them
+                    leaves = {leaf.tag: leaf.text for leaf in pl}
+                    af = (leaves.get(f"{conf}family") or "").strip().lower()
                     if "ipv6" in af:
                         prefix_type = "inet6"
                     else:
                         prefix_type = "inet"
 
-                    prefix_limit.update(
-                        {
-                            prefix_type: {
-                                af: {
-                                    "limit": self._find_txt(
-                                        pl, "configure_ns:maximum", namespaces=self.nsmap
-                                    ),
-                                    "teardown": {
-                                        "threshold": self._find_txt(
-                                            pl,
-                                            "configure_ns:threshold",
-                                            namespaces=self.nsmap,
-                                        ),
-                                        "timeout": self._find_txt(
-                                            pl,
-                                            "configure_ns:idle-timeout",
-                                            namespaces=self.nsmap,
-                                        ),
-                                    },
-                                }
-                            }
-                        }
-                    )
+                    # one entry per family, several families can share a prefix type
+                    prefix_limit.setdefault(prefix_type, {})[af] = {
+                        "limit": (leaves.get(f"{conf}maximum") or "").strip(),
+                        "teardown": {
+                            "threshold": (leaves.get(f"{conf}threshold") or "").strip(),
+                            "timeout": (leaves.get(f"{conf}idle-timeout") or "").strip(),
+                        },
+                    }
                 return prefix_limit
 
-            def _get_policies(policies_xml):
-                policies = [ele.text for ele in policies_xml]
-                return ", ".join(policies)
+            def _get_policies(xml, direction):
+                return ", ".join(_XP_POLICIES[direction](xml))
 
-            def _route_reflect(xml):
-              _cluster_id = self._find_txt(xml,"configure_ns:cluster/configure_ns:cluster-id",namespaces=self.nsmap)
-              _client_reflect = self._find_txt(xml,"configure_ns:client-reflect", namespaces=self.nsmap)
+            def _route_reflect(xml, conf=_CONF):
+              _cluster_id = _ft(xml, _CONF_CLUSTER_ID)
+              _client_reflect = _ft(xml, f"{conf}client-reflect")
               return (bool(_cluster_id),_client_reflect) # keep client_reflect as string to distinguish between not set and 'false'
 
-            def _get_bgp_neighbor_group(bgp_neighbors,global_autonomous):
+            def _get_bgp_neighbor_group(bgp_neighbors,global_autonomous,conf=_CONF,
+                                        ip=ip,convert=convert,_as_number=_as_number):
                 for bgp_neighbor in bgp_neighbors:
-                    group_name = self._find_txt(
-                        bgp_neighbor, "configure_ns:group", namespaces=self.nsmap
-                    )
+                    group_name = _ft(bgp_neighbor, f"{conf}group")
 
                     def _group_attr(attr):
-                      return bgp_groups[group_name][attr] if group_name in bgp_groups and attr in bgp_groups[group_name] else None
+                      source = group_flags if attr.startswith("_") else bgp_groups
+                      return source.get(group_name, {}).get(attr)
 
                     peer = ip(
-                        self._find_txt(
-                            bgp_neighbor, "configure_ns:ip-address", namespaces=self.nsmap
-                        )
+                        _ft(bgp_neighbor, f"{conf}ip-address")
                     )
 
                     if neighbor != "" and peer != neighbor:
                         continue
 
                     # JvB note: 'type' configuration allows implicit peer AS configuration for iBGP
-                    type_ = self._find_txt(
-                        bgp_neighbor, "configure_ns:type", namespaces=self.nsmap
-                    ) or _group_attr('type')
+                    type_ = _ft(bgp_neighbor, f"{conf}type") or _group_attr('type')
 
-                    _nhs = self._find_txt(
-                        bgp_neighbor,"configure_ns:next-hop-self",namespaces=self.nsmap,
-                    )
+                    _nhs = _ft(bgp_neighbor, f"{conf}next-hop-self")
                     _next_hop_self = (_nhs != "false") if _nhs else _group_attr('_nhs')
 
                     _cluster_id,_client_reflect = _route_reflect(bgp_neighbor)
                     route_reflector = (_cluster_id or _group_attr('_cluster_id')) \
                                   and (_group_attr('_client_reflect') and _client_reflect=="")
 
-                    explicit_local_as = self._find_txt(
-                        bgp_neighbor,
-                        "configure_ns:local-as/configure_ns:as-number",
-                        namespaces=self.nsmap,
-                    )
+                    explicit_local_as = _ft(bgp_neighbor, _CONF_LOCAL_AS_NUMBER)
 
                     # Order of priority:
                     # 1. Neighbor level local-as
@@ -2713,9 +2770,7 @@ class NokiaSROSDriver(NetworkDriver):
                     # 3. Global AS
                     local_as = explicit_local_as or _group_attr('local_as') or global_autonomous
 
-                    explicit_peer_as = self._find_txt(
-                        bgp_neighbor, "configure_ns:peer-as", namespaces=self.nsmap
-                    )
+                    explicit_peer_as = _ft(bgp_neighbor, f"{conf}peer-as")
 
                     if explicit_peer_as:
                       peer_as = explicit_peer_as
@@ -2728,78 +2783,46 @@ class NokiaSROSDriver(NetworkDriver):
                       else:
                         peer_as = 0 # Not configured
 
-                    if group_name not in bgp_group_neighbors.keys():
-                        bgp_group_neighbors[group_name] = {}
-                    bgp_group_neighbors[group_name][peer] = {
-                        "description": self._find_txt(
-                            bgp_neighbor, "configure_ns:description", namespaces=self.nsmap
-                        ),
-                        "local_as": as_number(local_as),
-                        "remote_as": as_number(peer_as),
+                    # groups of an instance are read before its neighbors, so the
+                    # neighbor goes straight into its group (or the ungrouped set)
+                    if group_name in bgp_groups:
+                        group_neighbors = bgp_groups[group_name]["neighbors"]
+                    elif group_name == "":
+                        group_neighbors = ungrouped_neighbors
+                    else:
+                        continue
+                    group_neighbors[peer] = {
+                        "description": _ft(bgp_neighbor, f"{conf}description"),
+                        "local_as": _as_number(local_as),
+                        "remote_as": _as_number(peer_as),
                         "prefix_limit": _build_prefix_limit(bgp_neighbor),
-                        "import_policy": _get_policies(
-                            bgp_neighbor.xpath(
-                                "configure_ns:import/configure_ns:policy",
-                                namespaces=self.nsmap,
-                            )
-                        ),
-                        "export_policy": _get_policies(
-                            bgp_neighbor.xpath(
-                                "configure_ns:export/configure_ns:policy",
-                                namespaces=self.nsmap,
-                            )
-                        ),
+                        "import_policy": _get_policies(bgp_neighbor, "import"),
+                        "export_policy": _get_policies(bgp_neighbor, "export"),
                         "local_address": convert(
                             ip,
-                            self._find_txt(
-                                bgp_neighbor,
-                                "configure_ns:local-address",
-                                namespaces=self.nsmap,
-                            ),
+                            _ft(bgp_neighbor, f"{conf}local-address"),
                         ),
                         # Note: ignoring any group level authentication key here
-                        "authentication_key": self._find_txt(
-                            bgp_neighbor,
-                            "configure_ns:authentication-key",
-                            namespaces=self.nsmap,
-                        ),
+                        "authentication_key": _ft(bgp_neighbor, f"{conf}authentication-key"),
                         "nhs": bool(_next_hop_self),
                         "route_reflector_client": route_reflector,
                     }
                     if neighbor != "" and peer == neighbor:
                         break
 
-            def _get_bgp_group_data(bgp_groups_list,local_as_number,g_cluster_id,g_client_reflect):
+            def _get_bgp_group_data(bgp_groups_list,local_as_number,g_cluster_id,g_client_reflect,conf=_CONF,
+                                    ip=ip,convert=convert,_as_number=_as_number):
                 for bgp_group in bgp_groups_list:
-                    group_name = self._find_txt(
-                        bgp_group, "configure_ns:group-name", namespaces=self.nsmap
-                    )
+                    group_name = _ft(bgp_group, f"{conf}group-name")
                     if group != "" and group != group_name:
                         continue
 
-                    remove_private = (
-                        True
-                        if self._find_txt(
-                            bgp_group,
-                            "configure_ns:remove-private/configure_ns:limited",
-                            namespaces=self.nsmap,
-                        )
-                        == "true"
-                        else False
-                    )
-                    type_ = self._find_txt(
-                        bgp_group, "configure_ns:type", namespaces=self.nsmap
-                    )
-                    explicit_local_as = self._find_txt(
-                        bgp_group,
-                        "configure_ns:local-as/configure_ns:as-number",
-                        namespaces=self.nsmap,
-                    )
+                    remove_private = _XP_REMOVE_PRIVATE(bgp_group)
+                    type_ = _ft(bgp_group, f"{conf}type")
+                    explicit_local_as = _ft(bgp_group, _CONF_LOCAL_AS_NUMBER)
                     local_as = int(explicit_local_as or local_as_number)
 
-                    explicit_peer_as = self._find_txt(
-                        bgp_group, "configure_ns:peer-as", namespaces=self.nsmap
-                    )
+                    explicit_peer_as = _ft(bgp_group, f"{conf}peer-as")
                     if explicit_peer_as:
                       peer_as = int(explicit_peer_as)
                       type_ = "internal" if peer_as==local_as else "external"
@@ -2809,132 +2832,81 @@ class NokiaSROSDriver(NetworkDriver):
                       peer_as = 0 # Not configured, type_ may be 'no-type'
 
                     xbgp = "ibgp" if type_=="internal" else "ebgp"
-                    max_path = self._find_txt(
-                        bgp_group,
-                        f"../configure_ns:multipath/configure_ns:{xbgp}",
-                        namespaces=self.nsmap,
-                    )
+                    max_path = _XP_MULTIPATH[xbgp](bgp_group).strip()
                     multipath = bool( peer_as and max_path and int(max_path)>1 )
 
-                    _nhs = self._find_txt(bgp_group, "configure_ns:next-hop-self", namespaces=self.nsmap)
+                    _nhs = _ft(bgp_group, f"{conf}next-hop-self")
                     # Can only set client_reflect to 'false' at group level
                     _cluster_id,_client_reflect = _route_reflect(bgp_group)
 
-                    apply_groups_list = []
-                    for apply_group in bgp_group.xpath(
-                        "configure_ns:apply-groups", namespaces=self.nsmap
-                    ):
-                        apply_groups_list.append(apply_group)
+                    apply_groups_list = bgp_group.findall(f"{conf}apply-groups")
 
+                    # neighbor defaults, not part of the returned group
+                    group_flags[group_name] = {
+                        "_nhs": bool(_nhs != "false"),
+                        "_cluster_id": g_cluster_id or bool(_cluster_id),
+                        "_client_reflect": g_client_reflect and _client_reflect=="",
+                    }
+                    # groups with the same name in several instances are merged,
+                    # keeping the neighbors collected so far
+                    previous = bgp_groups.get(group_name)
                     bgp_groups[group_name] = {
                         "type": type_,
-                        "description": self._find_txt(
-                            bgp_group, "configure_ns:description", namespaces=self.nsmap
-                        ),
+                        "description": _ft(bgp_group, f"{conf}description"),
                         "apply_groups": apply_groups_list,
-                        "local_as": as_number(local_as),
-                        "remote_as": as_number(peer_as),
+                        "local_as": _as_number(local_as),
+                        "remote_as": _as_number(peer_as),
                         "remove_private_as": remove_private,
-                        "import_policy": _get_policies(
-                            bgp_group.xpath(
-                                "configure_ns:import/configure_ns:policy",
-                                namespaces=self.nsmap,
-                            )
-                        ),
-                        "export_policy": _get_policies(
-                            bgp_group.xpath(
-                                "configure_ns:export/configure_ns:policy",
-                                namespaces=self.nsmap,
-                            )
-                        ),
+                        "import_policy": _get_policies(bgp_group, "import"),
+                        "export_policy": _get_policies(bgp_group, "export"),
                         "local_address": convert(
                             ip,
-                            self._find_txt(
-                                bgp_group,
-                                "configure_ns:local-address",
-                                namespaces=self.nsmap,
-                            ),
+                            _ft(bgp_group, f"{conf}local-address"),
                         ),
                         "multipath": multipath,
                         "multihop_ttl": convert(
                             int,
-                            self._find_txt(
-                                bgp_group, "configure_ns:multihop", namespaces=self.nsmap
-                            ),
+                            _ft(bgp_group, f"{conf}multihop"),
                             default=-1,
                         ),
                         "prefix_limit": _build_prefix_limit(bgp_group),
-                        "_nhs": bool(_nhs != "false"),
-                        "_cluster_id": g_cluster_id or bool(_cluster_id),
-                        "_client_reflect": g_client_reflect and _client_reflect=="",
-                        "neighbors": {},
+                        "neighbors": previous["neighbors"] if previous else {},
                     }
                     if group != "" and group == group_name:
                         break
 
-            bgp_running_config = to_ele(
-                self.conn.get(
+            if self.cache_ttl:
+                # group and neighbor are applied below, on the shared reply
+                bgp_running_config = self._get_bgp_etree()
+            else:
+                bgp_running_config = self.conn.get(
                     filter=GET_BGP_CONFIG["_"].format(group_name=group, neighbor=neighbor),
                     with_defaults="report-all",
-                ).data_xml
-            )
+                ).data_ele
             # print( to_xml(bgp_running_config, pretty_print=True) )
 
-            bgp_group_neighbors = {}
             bgp_groups = {}
-            global_as = self._find_txt(
-                bgp_running_config,
-                "configure_ns:configure/configure_ns:router/configure_ns:autonomous-system",
-                namespaces=self.nsmap,
-            )
-
-            for router in bgp_running_config.xpath(
-                "configure_ns:configure/configure_ns:router/configure_ns:bgp",
-                namespaces=self.nsmap,
-            ):
-                _cluster_id,_client_reflect = _route_reflect(router)
-                _get_bgp_group_data(
-                    router.xpath("configure_ns:group", namespaces=self.nsmap),
-                    local_as_number=int(global_as),
-                    g_cluster_id=_cluster_id,g_client_reflect=_client_reflect
-                )
-                _get_bgp_neighbor_group(
-                    router.xpath("configure_ns:neighbor", namespaces=self.nsmap),
-                    global_as,
-                )
-
-            for vprn in bgp_running_config.xpath(
-                "configure_ns:configure/configure_ns:service/configure_ns:vprn/configure_ns:bgp",
-                namespaces=self.nsmap,
-            ):
-                vprn_as = self._find_txt(
-                    vprn,"../configure_ns:autonomous-system",
-                    namespaces=self.nsmap,
-                )
-                _cluster_id,_client_reflect = _route_reflect(vprn)
+            group_flags = {}
+            ungrouped_neighbors = {}
+            # Base router and VPRN instances in one pass, each takes the
+            # autonomous-system of its parent router or vprn
+            for bgp in _XP_BGP_INSTANCES(bgp_running_config):
+                instance_as = _XP_PARENT_AS(bgp).strip()
+                _cluster_id,_client_reflect = _route_reflect(bgp)
                 _get_bgp_group_data(
-                    vprn.xpath("configure_ns:group", namespaces=self.nsmap),
-                    local_as_number=int(vprn_as),
+                    bgp.findall(f"{_CONF}group"),
+                    local_as_number=int(instance_as),
                     g_cluster_id=_cluster_id,g_client_reflect=_client_reflect
                 )
                 _get_bgp_neighbor_group(
-                    vprn.xpath("configure_ns:neighbor",namespaces=self.nsmap),
-                    vprn_as,
+                    _XP_BGP_NEIGHBOR_BY_IP(bgp, ip=neighbor)
+                    if neighbor
+                    else bgp.findall(f"{_CONF}neighbor"),
+                    instance_as,
                 )
 
-            # Assemble groups and neighbors
-            for grp_name, grp_data in bgp_groups.items():
-                neighbors = bgp_group_neighbors.get(grp_name, {})
-
-                grp_data.pop("_nhs")  # remove temporary keys
-                grp_data.pop("_cluster_id")
-                grp_data.pop("_client_reflect")
-
-                grp_data["neighbors"] = neighbors  # Add updated neighbors to group
-
-                bgp_config[grp_name] = grp_data  # Add group with neighbors to output dict
-
-            if "" in bgp_group_neighbors.keys():
+            bgp_config = bgp_groups
+            if ungrouped_neighbors:
                 bgp_config["_"] = {
                     "apply_groups": [],
                     "description": "",
@@ -2948,7 +2920,7 @@ class NokiaSROSDriver(NetworkDriver):
                     "remote_as": 0,
                     "remove_private_as": False,
                     "prefix_limit": {},
-                    "neighbors": bgp_group_neighbors.get("", {}),
+                    "neighbors": ungrouped_neighbors,
                 }
 
             return bgp_config
@@ -2967,41 +2939,15 @@ class NokiaSROSDriver(NetworkDriver):
         try:
             lldp_neighbors = {}
 
-            root = to_ele(self.conn.get(filter=GET_LLDP_NEIGHBORS["_"]).data_xml)
+            root = self.conn.get(filter=GET_LLDP_NEIGHBORS["_"]).data_ele
 
-            path = (
-                "state_ns:ethernet/state_ns:lldp/state_ns:dest-mac/state_ns:remote-system/"
-            )
-            for port in root.xpath("state_ns:state/state_ns:port", namespaces=self.nsmap):
-                port_id = self._find_txt(
-                    port, "state_ns:port-id", namespaces=self.nsmap
-                )  # port name
-                port_op_state = self._find_txt(
-                    port, "state_ns:oper-state", namespaces=self.nsmap
-                ).lower()
-                if port_op_state != "up" or port_id == "":
-                    continue
-                # if no remote_chassis_id is present (mandatory TLV),
-                # then no LLDP neighbor is behind the port
-                remote_chassis_id = self._find_txt(
-                    port, f"{path}state_ns:chassis-id", namespaces=self.nsmap
-                )
-                if remote_chassis_id == "":
-                    continue
-                remote_system_name = self._find_txt(
-                    port, f"{path}state_ns:system-name", namespaces=self.nsmap
-                )
-                remote_port_id = self._find_txt(
-                    port, f"{path}state_ns:remote-port-id", namespaces=self.nsmap
+            for port in _XP_LLDP_PORT(root):
+                port_id = self._find_txt(port, _XP_PORT_ID)  # port name
+                remote_system_name = self._find_txt(port, _XP_LLDP_REMOTE["system-name"])
+                remote_port_id = self._find_txt(port, _XP_LLDP_REMOTE["remote-port-id"])
+                lldp_neighbors.setdefault(port_id, []).append(
+                    {"hostname": remote_system_name, "port": remote_port_id}
                 )
-                if port_id not in lldp_neighbors.keys():
-                    lldp_neighbors[port_id] = [
-                        {"hostname": remote_system_name, "port": remote_port_id}
-                    ]
-                else:
-                    lldp_neighbors[port_id].append(
-                        {"hostname": remote_system_name, "port": remote_port_id}
-                    )
 
             return lldp_neighbors
         except Exception as e:
@@ -3036,53 +2982,23 @@ class NokiaSROSDriver(NetworkDriver):
         try:
             lldp_neighbors_details = {}
 
-            root = to_ele(
-                self.conn.get(
-                    filter=GET_LLDP_NEIGHBORS_DETAIL["_"].format(port_id=interface)
-                ).data_xml
-            )
-            for port in root.xpath("state_ns:state/state_ns:port", namespaces=self.nsmap):
-                port_id = self._find_txt(
-                    port, "state_ns:port-id", namespaces=self.nsmap
-                )  # port name
-                port_op_state = self._find_txt(
-                    port, "state_ns:oper-state", namespaces=self.nsmap
-                ).lower()
-                if port_id == "" or port_op_state != "up":
-                    continue
-                path = "state_ns:ethernet/state_ns:lldp/state_ns:dest-mac/state_ns:remote-system/"
-                remote_chassis_id = self._find_txt(
-                    port, f"{path}state_ns:chassis-id", namespaces=self.nsmap
-                )
-                # if no remote_chassis_id is present (mandatory TLV),
-                # then no LLDP neighbor is behind the port
-                if remote_chassis_id == "":
-                    continue
-                remote_system_name = self._find_txt(
-                    port, f"{path}state_ns:system-name", namespaces=self.nsmap
-                )
-                remote_port_id = self._find_txt(
-                    port, f"{path}state_ns:remote-port-id", namespaces=self.nsmap
-                )
-                remote_port_desc = self._find_txt(
-                    port, f"{path}state_ns:port-description", namespaces=self.nsmap
-                )
-                remote_system_description = self._find_txt(
-                    port, f"{path}state_ns:system-description", namespaces=self.nsmap
-                )
-                remote_system_capab = self._find_txt(
-                    port,
-                    f"{path}state_ns:system-supported-capabilities",
-                    namespaces=self.nsmap,
-                )
-                remote_system_enable_capab = self._find_txt(
-                    port,
-                    f"{path}state_ns:system-enabled-capabilities",
-                    namespaces=self.nsmap,
-                )
-                if port_id not in lldp_neighbors_details.keys():
-                    lldp_neighbors_details[port_id] = []
-                lldp_neighbors_details[port_id].append(
+            root = self.conn.get(
+                filter=GET_LLDP_NEIGHBORS_DETAIL["_"].format(port_id=interface)
+            ).data_ele
+            for port in _XP_LLDP_PORT(root):
+                port_id = self._find_txt(port, _XP_PORT_ID)  # port name
+                remote_chassis_id = self._find_txt(port, _XP_LLDP_REMOTE["chassis-id"])
+                remote_system_name = self._find_txt(port, _XP_LLDP_REMOTE["system-name"])
+                remote_port_id = self._find_txt(port, _XP_LLDP_REMOTE["remote-port-id"])
+                remote_port_desc = self._find_txt(port, _XP_LLDP_REMOTE["port-description"])
+                remote_system_description = self._find_txt(port, _XP_LLDP_REMOTE["system-description"])
+                remote_system_capab = _XP_LLDP_CAPABILITIES[
+                    "system-supported-capabilities"
+                ](port)
+                remote_system_enable_capab = _XP_LLDP_CAPABILITIES[
+                    "system-enabled-capabilities"
+                ](port)
+                lldp_neighbors_details.setdefault(port_id, []).append(
                     {
                         "parent_interface": "",
                         "remote_chassis_id": remote_chassis_id,
@@ -3127,25 +3043,16 @@ class NokiaSROSDriver(NetworkDriver):
                 "memory": {},
             }
 
-            # helpers functions
-            def _build_temperature_dict(instance, choice=1):
-                temp = convert(
-                    float,
-                    self._find_txt(
-                        instance,
-                        "state_ns:hardware-data/state_ns:temperature",
-                        namespaces=self.nsmap,
-                    ),
-                )
+            # helpers functions, convert and _find_txt are bound as default
+            # arguments, local lookups for every cpm, card and mda
+            def _build_temperature_dict(
+                instance, location, convert=convert, find_txt=self._find_txt
+            ):
+                temp = convert(float, find_txt(instance, _XP_HW_TEMPERATURE))
                 if temp == "":
                     return
                 temp_thresh = convert(
-                    float,
-                    self._find_txt(
-                        instance,
-                        "state_ns:hardware-data/state_ns:temperature-threshold",
-                        namespaces=self.nsmap,
-                    ),
+                    float, find_txt(instance, _XP_HW_TEMPERATURE_THRESHOLD)
                 )
                 if temp_thresh == "":
                     return
@@ -3153,43 +3060,21 @@ class NokiaSROSDriver(NetworkDriver):
                 # Assume warning temperature is 80% of the threshold tempearature
                 temp_warn = 0.8 * temp_thresh
 
-                data = {
+                # location is one of "cpm", "card" or "mda", the last one read wins
+                environment_data["temperature"][location] = {
                     "temperature": temp,
-                    "is_alert": True if temp >= temp_warn else False,
-                    "is_critical": True if temp >= temp_thresh else False,
+                    "is_alert": temp >= temp_warn,
+                    "is_critical": temp >= temp_thresh,
                 }
 
-                if choice == 1:
-                    environment_data["temperature"].update({"cpm": {}})
-                    environment_data["temperature"]["cpm"].update(data)
-                elif choice == 2:
-                    environment_data["temperature"].update({"card": {}})
-                    environment_data["temperature"]["card"].update(data)
-                elif choice == 3:
-                    environment_data["temperature"].update({"mda": {}})
-                    environment_data["temperature"]["mda"].update(data)
-
-            result = to_ele(
-                self.conn.get(
-                    filter=GET_ENVIRONMENT["_"], with_defaults="report-all"
-                ).data_xml
-            )
+            result = self.conn.get(
+                filter=GET_ENVIRONMENT["_"], with_defaults="report-all"
+            ).data_ele
 
-            for fan in result.xpath(
-                "state_ns:state/state_ns:chassis/state_ns:fan", namespaces=self.nsmap
-            ):
-                fan_slot = self._find_txt(fan, "state_ns:fan-slot", namespaces=self.nsmap)
-
-                oper_state = (
-                    True
-                    if self._find_txt(
-                        fan,
-                        "state_ns:hardware-data/state_ns:oper-state",
-                        namespaces=self.nsmap,
-                    )
-                    == "in-service"
-                    else False
-                )
+            for fan in _XP_FAN(result):
+                fan_slot = self._find_txt(fan, _XP_FAN_SLOT)
+
+                oper_state = _XP_HW_IN_SERVICE(fan)
                 environment_data["fans"].update({fan_slot: {"status": oper_state}})
 
             # get the output of each power-module using MD-CLI
@@ -3201,42 +3086,18 @@ class NokiaSROSDriver(NetworkDriver):
                 True,
                 no_more=True
             )
-            total_power_modules = 0
-            output = 0.0
-            for item in buff.split("\n"):
-                if "Power Module" in item:
-                    total_power_modules = total_power_modules + 1
-                if "Current Util." in item:
-                    item.strip()
-                    watts = re.match(r"^.*:\s*(\d+[.]\d+) Watts.*$", item)
-                    if watts:
-                        output = float(watts.groups()[0])
-
-            for power_module in result.xpath(
-                "state_ns:state/state_ns:chassis/state_ns:power-shelf/state_ns:power-module",
-                namespaces=self.nsmap,
-            ):
+            total_power_modules = len(_POWER_MODULE_LINE_RE.findall(buff))
+            # the last utilization line reported wins
+            watts = _POWER_UTIL_RE.findall(buff)
+            output = float(watts[-1]) if watts else 0.0
+
+            for power_module in _XP_POWER_MODULE(result):
                 power_module_id = convert(
-                    int,
-                    self._find_txt(
-                        power_module, "state_ns:power-module-id", namespaces=self.nsmap
-                    ),
-                )
-                oper_state = (
-                    True
-                    if self._find_txt(
-                        power_module,
-                        "state_ns:hardware-data/state_ns:oper-state",
-                        namespaces=self.nsmap,
-                    )
-                    == "in-service"
-                    else False
+                    int, self._find_txt(power_module, _XP_POWER_MODULE_ID)
                 )
+                oper_state = _XP_HW_IN_SERVICE(power_module)
                 capacity = convert(
-                    float,
-                    self._find_txt(
-                        power_module, "state_ns:available-wattage", namespaces=self.nsmap
-                    ),
+                    float, self._find_txt(power_module, _XP_AVAILABLE_WATTAGE)
                 )
                 environment_data["power"].update(
                     {
@@ -3248,51 +3109,26 @@ class NokiaSROSDriver(NetworkDriver):
                     }
                 )
 
-            for cpm in result.xpath("state_ns:state/state_ns:cpm", namespaces=self.nsmap):
-                _build_temperature_dict(cpm, choice=1)
+            for cpm in _XP_CPM(result):
+                _build_temperature_dict(cpm, "cpm")
 
-            for card in result.xpath("state_ns:state/state_ns:card", namespaces=self.nsmap):
-                _build_temperature_dict(card, choice=2)
-                for mda in card.xpath("state_ns:mda", namespaces=self.nsmap):
-                    _build_temperature_dict(mda, choice=3)
+            for card in _XP_CARD(result):
+                _build_temperature_dict(card, "card")
+                for mda in _XP_MDA(card):
+                    _build_temperature_dict(mda, "mda")
 
-            for system in result.xpath(
-                "state_ns:state/state_ns:system", namespaces=self.nsmap
-            ):
+            for system in _XP_SYSTEM(result):
                 available_ram = convert(
-                    int,
-                    self._find_txt(
-                        system,
-                        "state_ns:memory-pools/state_ns:summary/state_ns:available-memory",
-                        namespaces=self.nsmap,
-                    ),
-                )
-                used_ram = convert(
-                    int,
-                    self._find_txt(
-                        system,
-                        "state_ns:memory-pools/state_ns:summary/state_ns:total-in-use",
-                        namespaces=self.nsmap,
-                    ),
+                    int, self._find_txt(system, _XP_AVAILABLE_MEMORY)
                 )
+                used_ram = convert(int, self._find_txt(system, _XP_TOTAL_IN_USE))
                 environment_data.update({"cpu": {}})
-                for cpu in result.xpath(
-                    "state_ns:state/state_ns:system/state_ns:cpu", namespaces=self.nsmap
-                ):
+                for cpu in _XP_SYSTEM_CPU(result):
                     sample_period = convert(
-                        int,
-                        self._find_txt(
-                            cpu, "state_ns:sample-period", namespaces=self.nsmap
-                        ),
+                        int, self._find_txt(cpu, _XP_SAMPLE_PERIOD)
                     )
                     cpu_usage = convert(
-                        float,
-                        self._find_txt(
-                            cpu,
-                            "state_ns:summary/state_ns:usage/state_ns:cpu-usage",
-                            namespaces=self.nsmap,
-                        ),
-                        default=-1,
+                        float, self._find_txt(cpu, _XP_CPU_USAGE), default=-1
                     )
                     environment_data["cpu"].update({str(sample_period): {"%usage": cpu_usage}})
 
@@ -3318,59 +3154,71 @@ class NokiaSROSDriver(NetworkDriver):
             state (string)
         """
         try:
-            result = to_ele(
-                self.conn.get(
-                    filter=GET_IPV6_NEIGHBORS_TABLE["_"], with_defaults="report-all"
-                ).data_xml
+            result = self.conn.get(
+                filter=GET_IPV6_NEIGHBORS_TABLE["_"], with_defaults="report-all"
+            ).data_ele
+            name_list = [
+                names[0] if names else ""
+                for names in map(_XP_ROUTER_NAME, _XP_ROUTER(result))
+            ]
+            name_list.extend(
+                ids[0] if ids else ""
+                for ids in map(_XP_VPRN_SERVICE_ID, _XP_VPRN(result))
             )
-            name_list = []
-            for router in result.xpath(
-                "state_ns:state/state_ns:router", namespaces=self.nsmap
-            ):
-                name_list.append(
-                    self._find_txt(router, "state_ns:router-name", namespaces=self.nsmap)
-                )
-            for vprn in result.xpath(
-                "state_ns:state/state_ns:service/state_ns:vprn", namespaces=self.nsmap
-            ):
-                name_list.append(
-                    self._find_txt(vprn, "state_ns:oper-service-id", namespaces=self.nsmap)
-                )
 
             ipv6_neighbor_list = []
+            # latest entry for each address, the one the following row completes
+            ipv6_by_ip = {}
+
+            # one batch for all the routing instances
+            commands = [f"/show router {name} neighbor" for name in name_list]
+            buff = self._perform_cli_commands(commands, True, no_more=True)
+            if buff is None:
+                # the batch failed, send the instances one by one and skip
+                # those with no output, as the other instances are still valid
+                buff = "".join(
+                    filter(
+                        None,
+                        (
+                            self._perform_cli_commands([cmd], True, no_more=True)
+                            for cmd in commands
+                        ),
+                    )
+                )
+            prev_row = []
+            ip_address = ""
+            for item in buff.splitlines():
+                if _CLI_PROMPT_LINE_RE.match(item):
+                    # the next instance starts, drop an entry left half-parsed
+                    prev_row = []
+                    ip_address = ""
+                elif prev_row or _starts_with_ipv6(item):
+                    # split() without arguments already drops the surrounding whitespace
+                    row_list = prev_row = item.split()
+                    if len(row_list) == 2:
+                        ip_address = row_list[0]
+                        temp_dict = {"ip": row_list[0], "interface": row_list[1]}
+                        ipv6_neighbor_list.append(temp_dict)
+                        ipv6_by_ip[ip_address] = temp_dict
+                    if len(row_list) > 2:
+                        # expiry is formatted as "00h00m03s"
+                        hours, _, rest = row_list[2].partition("h")
+                        minutes, _, rest = rest.partition("m")
+                        seconds = (
+                            (int(hours) * 3600)
+                            + (int(minutes) * 60)
+                            + (int(rest.rstrip("s")))
+                        )
+                        temp_dict_1 = {
+                            "mac": row_list[0],
+                            "state": row_list[1].lower(),
+                            "age": convert(float, seconds, default=-1),
+                        }
 
-            for name in name_list:
-                cmd = [f"/show router {name} neighbor"]
-                buff = self._perform_cli_commands(cmd, True, no_more=True)
-                prev_row = ""
-                ip_address = ""
-                for item in buff.split("\n"):
-                    if self.ipv6_address_re.search(item) or prev_row:
-                        row = item.strip()
-                        prev_row = row
-                        row_list = row.split()
-                        if len(row_list) == 2:
-                            ip_address = row_list[0]
-                            temp_dict = {"ip": row_list[0], "interface": row_list[1]}
-                            ipv6_neighbor_list.append(temp_dict)
-                        if len(row_list) > 2:
-                            time_string = re.split("h|m|s", row_list[2])
-                            seconds = (
-                                (int(time_string[0]) * 3600)
-                                + (int(time_string[1]) * 60)
-                                + (int(time_string[2]))
-                            )
-                            temp_dict_1 = {
-                                "mac": row_list[0],
-                                "state": row_list[1].lower(),
-                                "age": convert(float, seconds, default=-1),
-                            }
-
-                            for dictionary in ipv6_neighbor_list:
-                                if dictionary.get("ip") == ip_address:
-                                    dictionary.update(temp_dict_1)
-                            prev_row = ""
-                            ip_address = ""
+                        if ip_address in ipv6_by_ip:
+                            ipv6_by_ip[ip_address].update(temp_dict_1)
+                        prev_row = []
+                        ip_address = ""
 
             return ipv6_neighbor_list
         except Exception as e:
@@ -3396,19 +3244,7 @@ class NokiaSROSDriver(NetworkDriver):
             if ttl > 128:
                 ttl = 128
             results = []
-            command = ""
-            if source and vrf:
-                command = (
-                    "ping {d1} timeout {d2} ttl {d3} source-address {d4} size {d5} "
-                    "count {d6} router-instance {d7}"
-                )
-            elif not source and not vrf:
-                command = "ping {d1} timeout {d2} ttl {d3} size {d5} count {d6}"
-            elif source:
-                command = "ping {d1} timeout {d2} ttl {d3} source-address {d4} size {d5} count {d6}"
-            elif vrf:
-                command = "ping {d1} timeout {d2} ttl {d3} size {d5} count {d6} router-instance {d7}"
-            command = command.format(
+            command = _PING_CMDS[bool(source), bool(vrf)].format(
                 d1=destination,
                 d2=str(timeout),
                 d3=str(ttl),
@@ -3418,26 +3254,26 @@ class NokiaSROSDriver(NetworkDriver):
                 d7=vrf,
             )
             buff = self._perform_cli_commands([command], True, no_more=True)
-            for item in buff.split("\n"):
-                if "No route to destination" in item:
+            for match in _PING_LINE_RE.finditer(buff):
+                kind = match.lastgroup
+                if kind == "error":
                     value = "unknown host " + destination
                     ping.update({"error": value})
                     return ping
-                elif "icmp_seq" in item:
-                    row = item.strip()
+                row = match.group(kind).strip()
+                if kind == "probe":
                     if "\b" in row:
                         row = row.replace(".\b", "")
                         row = row.replace("\b", "")
                     row_list = row.split()
-                    rtt = row_list[6].split("=")
+                    rtt = row_list[6].partition("=")[2]
                     results.append(
                         {
-                            "ip_address": row_list[3].split(":")[0],
-                            "rtt": convert(float, rtt[1].split("m")[0]),
+                            "ip_address": row_list[3].partition(":")[0],
+                            "rtt": convert(float, rtt.partition("m")[0]),
                         }
                     )
-                elif "packets" in item:
-                    row = item.strip()
+                elif kind == "packets":
                     row_list = row.split()
                     ping.update(
                         {
@@ -3448,15 +3284,14 @@ class NokiaSROSDriver(NetworkDriver):
                             }
                         }
                     )
-                elif "round-trip" in item:
-                    row = item.strip()
+                elif kind == "round_trip":
                     row_list = row.split()
                     ping["success"].update(
                         {
-                            "rtt_min": convert(float, row_list[3].split("m")[0]),
-                            "rtt_avg": convert(float, row_list[6].split("m")[0]),
-                            "rtt_max": convert(float, row_list[9].split("m")[0]),
-                            "rtt_stddev": convert(float, row_list[12].split("m")[0]),
+                            "rtt_min": convert(float, row_list[3].partition("m")[0]),
+                            "rtt_avg": convert(float, row_list[6].partition("m")[0]),
+                            "rtt_max": convert(float, row_list[9].partition("m")[0]),
+                            "rtt_stddev": convert(float, row_list[12].partition("m")[0]),
                         }
                     )
                     ping["success"].update({"results": results})
@@ -3481,16 +3316,7 @@ class NokiaSROSDriver(NetworkDriver):
             traceroute = {}
             if timeout < 10 :
                 timeout = 10
-            cmd = ""
-            if source and vrf:
-                cmd = "traceroute {d1} wait {d2} ttl {d3} source-address {d4} router-instance {d5}"
-            elif not source and not vrf:
-                cmd = "traceroute {d1} wait {d2} ttl {d3}"
-            elif source:
-                cmd = "traceroute {d1} wait {d2} ttl {d3} source-address {d4}"
-            elif vrf:
-                cmd = "traceroute {d1} wait {d2} ttl {d3} router-instance {d5}"
-            cmd = cmd.format(
+            cmd = _TRACEROUTE_CMDS[bool(source), bool(vrf)].format(
                 d1=destination, d2=str(timeout), d3=str(ttl), d4=source, d5=vrf,
             )
             command = [
@@ -3498,40 +3324,28 @@ class NokiaSROSDriver(NetworkDriver):
                 cmd,
             ]
             buff = self._perform_cli_commands(command, True, no_more=True)
-            for item in buff.split("\n"):
-                if "* * *" in item:
+            for match in _TRACEROUTE_LINE_RE.finditer(buff):
+                if match.lastgroup == "error":
                     value = "unknown host " + destination
                     traceroute.update({"error": value})
                     return traceroute
-                elif "ms" in item:
+                else:
                     traceroute.update({"success": {}})
-                    row = item.strip()
+                    row = match.group("hop").strip()
                     row_list = row.split()
+                    # the three probes of a hop share its address and host name
+                    ip_address = row_list[2].partition("(")[2].partition(")")[0]
+                    host_name = row_list[1]
                     traceroute["success"].update(
                         {
                             row_list[0]: {
                                 "probes": {
-                                    "1": {
-                                        "rtt": convert(float, row_list[3]),
-                                        "ip_address": row_list[2]
-                                        .split("(")[1]
-                                        .split(")")[0],
-                                        "host_name": row_list[1],
-                                    },
-                                    "2": {
-                                        "rtt": convert(float, row_list[5]),
-                                        "ip_address": row_list[2]
-                                        .split("(")[1]
-                                        .split(")")[0],
-                                        "host_name": row_list[1],
-                                    },
-                                    "3": {
-                                        "rtt": convert(float, row_list[7]),
-                                        "ip_address": row_list[2]
-                                        .split("(")[1]
-                                        .split(")")[0],
-                                        "host_name": row_list[1],
-                                    },
+                                    probe: {
+                                        "rtt": convert(float, row_list[index]),
+                                        "ip_address": ip_address,
+                                        "host_name": host_name,
+                                    }
+                                    for probe, index in (("1", 3), ("2", 5), ("3", 7))
                                 }
                             }
                         }
@@ -3550,21 +3364,19 @@ class NokiaSROSDriver(NetworkDriver):
             raise NotImplementedError("%s is not a supported encoding" % encoding)
         try:
             cli_output = {}
+            cmd_line_search = self.cmd_line_pattern_re.search
             for cmd in commands:
                 buff = self._perform_cli_commands([cmd], True)
-                new_buff = ""
-                for item in buff.split("\n"):
-                    if "[]" in item:
-                        continue
-                    elif self.cmd_line_pattern_re.search(item):
-                        continue
-                    else:
-                        row = item.strip()
-                        if row == cmd:
-                            continue
-                        new_buff += row
-                        new_buff += "\n"
-                cli_output.update({cmd: new_buff})
+                rows = [
+                    row
+                    for row in (
+                        item.strip()
+                        for item in buff.split("\n")
+                        if "[]" not in item and not cmd_line_search(item)
+                    )
+                    if row != cmd
+                ]
+                cli_output.update({cmd: "".join(row + "\n" for row in rows)})
             return cli_output
         except Exception as e:
             print("Error in method cli : {}".format(e))
@@ -1,6 +1,30 @@
+import functools
+import io
 import os
 import textfsm
 
+# templates are looked up relative to this package, independent of the working directory
+_TEMPLATE_ROOT = os.path.dirname(os.path.realpath(__file__))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_template(template):
+    """
+    :param template: TextFSM template path, relative to this directory
+    :return: text of the template, read once and shared between calls
+    """
+    with open(os.path.join(_TEMPLATE_ROOT, template), "r") as template_file:
+        return template_file.read()
+
+
+def _get_fsm(template):
+    """
+    :param template: TextFSM template path, relative to this directory
+    :return: new TextFSM object for one parse, it holds the parse state so it is
+             never shared between calls (or threads)
+    """
+    return textfsm.TextFSM(io.StringIO(_get_template(template)))
+
 
 def parse_with_textfsm(template, command_output):
     """
@@ -8,18 +32,9 @@ def parse_with_textfsm(template, command_output):
     :param command_output: Command output from a node
     :return: List of dicts. Dict per FSM row.
     """
-    with open(os.path.join(os.path.dirname(os.path.realpath(__file__)), template), "r") as template_file:
-        fsm = textfsm.TextFSM(template_file)
-        fsm_results = fsm.ParseText(command_output)
-    output_list = []
-    # print fsm.header
-    for index, line in enumerate(fsm_results, 1):
-        # print line
-        textfsm_dict = {}
-        for number, value in enumerate(line):
-            textfsm_dict[fsm.header[number]] = value
-        output_list.append(textfsm_dict)
-    return output_list
+    fsm = _get_fsm(template)
+    fsm_results = fsm.ParseText(command_output)
+    return [dict(zip(fsm.header, line)) for line in fsm_results]
 
 
 def parse_with_textfsm_by_first_value(template, command_output):
@@ -28,18 +43,14 @@ def parse_with_textfsm_by_first_value(template, command_output):
     :param command_output: Command output from a node
     :return: Dict per first(top) textFSM template value
     """
-    with open(os.path.join(os.path.dirname(os.path.realpath(__file__)), template), "r") as template_file:
-        fsm = textfsm.TextFSM(template_file)
-        fsm_results = fsm.ParseText(command_output)
-    textfsm_dict = {}
-    # print fsm.header
-    for line in fsm_results:
-        # print line
-        textfsm_dict[line[0]] = {}
-        for number, value in enumerate(line):
-            if value != line[0]:
-                textfsm_dict[line[0]].update({fsm.header[number]: value})
-    return textfsm_dict
+    fsm = _get_fsm(template)
+    fsm_results = fsm.ParseText(command_output)
+    return {
+        line[0]: {
+            header: value for header, value in zip(fsm.header, line) if value != line[0]
+        }
+        for line in fsm_results
+    }
 
 
 if __name__ == '__main__':
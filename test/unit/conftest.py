@@ -138,6 +138,10 @@ class FakeGetReply:
     def data_xml(self):
         return to_ele(etree.fromstring(self._data.encode("UTF-8")))
 
+    @property
+    def data_ele(self):
+        return etree.fromstring(self._data.encode("UTF-8"))
+
 
 def to_ele(x):
     return x if etree.iselement(x) else etree.fromstring(x.encode("UTF-8"))
@@ -0,0 +1,111 @@
+"""Tests for the NETCONF reply cache enabled by the cache_ttl optional argument."""
+
+import json
+import os
+
+from conftest import PatchedNokiaSROSDriver
+
+from napalm_sros import sros
+
+MOCKED_DATA = os.path.join(os.path.dirname(__file__), "mocked_data")
+
+
+class CountingGet:
+    """Wraps the fake NETCONF get and records the filter of every call."""
+
+    def __init__(self, get):
+        self._get = get
+        self.filters = []
+
+    def __call__(self, filter="", with_defaults=""):
+        self.filters.append(filter)
+        return self._get(filter=filter, with_defaults=with_defaults)
+
+
+def _device(test_name, test_case="normal", cache_ttl=60):
+    """Returns a patched driver answering with the mocked data of test_name/test_case."""
+    device = PatchedNokiaSROSDriver(
+        "127.0.0.1", "vagrant", "vagrant", optional_args={"cache_ttl": cache_ttl}
+    )
+    for patched_attr in device.patched_attrs:
+        attr = getattr(device, patched_attr)
+        attr.current_test = test_name
+        attr.current_test_case = test_case
+    device.conn.get = CountingGet(device.conn.get)
+    return device
+
+
+def _expected_result(test_name, test_case="normal"):
+    with open(os.path.join(MOCKED_DATA, test_name, test_case, "expected_result.json")) as f:
+        return json.load(f)
+
+
+def test_probes_getters_share_one_get():
+    device = _device("test_get_probes_results")
+    probes_results = device.get_probes_results()
+    probes_config = device.get_probes_config()
+
+    assert len(device.conn.get.filters) == 1
+    assert json.loads(json.dumps(probes_results)) == _expected_result(
+        "test_get_probes_results"
+    )
+    assert list(probes_config) == list(probes_results)
+
+
+def test_probes_cache_disabled_by_default():
+    device = _device("test_get_probes_results", cache_ttl=0)
+    device.get_probes_results()
+    device.get_probes_config()
+
+    assert len(device.conn.get.filters) == 2
+
+
+def test_commit_config_drops_probes_cache():
+    device = _device("test_get_probes_results")
+    device.get_probes_config()
+    device.commit_config()
+    device.get_probes_config()
+
+    assert len(device.conn.get.filters) == 2
+
+
+def test_bgp_neighbors_with_cache():
+    device = _device("test_get_bgp_neighbors")
+    bgp_neighbors = device.get_bgp_neighbors()
+
+    assert device.conn.get.filters == [sros._GET_BGP_ALL]
+    assert json.loads(json.dumps(bgp_neighbors)) == _expected_result(
+        "test_get_bgp_neighbors"
+    )
+
+
+def test_bgp_neighbors_detail_with_cache():
+    device = _device("test_get_bgp_neighbors_detail")
+    bgp_neighbors_detail = device.get_bgp_neighbors_detail()
+    device.get_bgp_neighbors()
+
+    assert device.conn.get.filters == [sros._GET_BGP_ALL]
+    assert json.loads(json.dumps(bgp_neighbors_detail)) == _expected_result(
+        "test_get_bgp_neighbors_detail"
+    )
+
+
+def test_bgp_config_with_cache():
+    device = _device("test_get_bgp_config")
+    uncached = _device("test_get_bgp_config", cache_ttl=0)
+    bgp_config = device.get_bgp_config()
+
+    assert json.loads(json.dumps(bgp_config)) == _expected_result("test_get_bgp_config")
+    for group, neighbor in (
+        ("ebgp", ""),
+        ("ibgp-vprn", ""),
+        ("", "192.0.0.3"),
+        ("", "2001:192::1"),
+        ("ebgp", "192.0.0.1"),
+    ):
+        assert device.get_bgp_config(group=group, neighbor=neighbor) == (
+            uncached.get_bgp_config(group=group, neighbor=neighbor)
+        )
+    device.get_bgp_neighbors()
+
+    assert device.conn.get.filters == [sros._GET_BGP_ALL]
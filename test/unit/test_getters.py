@@ -1,6 +1,6 @@
 """Tests for getters."""
 
-from napalm.base.test.getters import BaseTestGetters
+from napalm.base.test.getters import BaseTestGetters, wrap_test_cases
 
 
 import pytest
@@ -9,3 +9,12 @@ import pytest
 @pytest.mark.usefixtures("set_device_parameters")
 class TestGetter(BaseTestGetters):
     """Test get_* methods."""
+
+    @wrap_test_cases
+    def test_cli(self, test_case):
+        """Test cli."""
+        commands = ["show version"]
+        get_cli = self.device.cli(commands)
+        assert list(get_cli) == commands
+
+        return get_cli
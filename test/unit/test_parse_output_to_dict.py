@@ -0,0 +1,31 @@
+"""Tests for the TextFSM helpers."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from napalm_sros.utils.parse_output_to_dict import parse_with_textfsm
+
+FDB_MAC_TEMPLATE = "textfsm_templates/nokia_sros_show_service_fdb_mac.tpl"
+FDB_MAC_OUTPUT = os.path.join(
+    os.path.dirname(__file__),
+    "mocked_data",
+    "test_get_mac_address_table",
+    "normal",
+    "_show_service_fdb-mac.txt",
+)
+
+
+def test_parse_with_textfsm_threads():
+    """Parses running in parallel threads do not share parse state."""
+    with open(FDB_MAC_OUTPUT) as output_file:
+        output = output_file.read()
+    expected = parse_with_textfsm(FDB_MAC_TEMPLATE, output)
+    assert expected
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(
+                lambda _: parse_with_textfsm(FDB_MAC_TEMPLATE, output), range(120)
+            )
+        )
+    assert all(result == expected for result in results)
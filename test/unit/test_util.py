@@ -0,0 +1,60 @@
+"""Tests for the api helpers."""
+
+import pytest
+from lxml import etree
+
+from napalm_sros.api.get_bgp_neighbors import GET_BGP_NEIGHBORS
+from napalm_sros.api.get_bgp_neighbors_detail import GET_BGP_NEIGHBORS_DETAILS
+from napalm_sros.api.util import _merge_filters
+from napalm_sros.nc_filters import GET_BGP_CONFIG
+
+
+def _selections(subtree_filter):
+    """Returns the path of every leaf selection and content match node of a filter."""
+    root = etree.fromstring(
+        subtree_filter.strip(), etree.XMLParser(remove_blank_text=True)
+    )
+    paths = set()
+    for element in root.iter():
+        if len(element) == 0:
+            path = "/".join(
+                etree.QName(node).localname
+                for node in reversed([element, *element.iterancestors()])
+            )
+            paths.add((path, (element.text or "").strip()))
+    return paths
+
+
+def _selected(paths, path):
+    """True if path is selected by one of paths, i.e. by itself or a selection node above it."""
+    return any(
+        path == selected or path.startswith(selected + "/") for selected, _ in paths
+    )
+
+
+def test_merge_filters_selects_union():
+    filters = (
+        GET_BGP_NEIGHBORS,
+        GET_BGP_NEIGHBORS_DETAILS.format(neighbor_address=""),
+        GET_BGP_CONFIG["_"].format(group_name="", neighbor=""),
+    )
+    merged = _selections(_merge_filters(*filters))
+    for subtree_filter in filters:
+        for path, _ in _selections(subtree_filter):
+            assert _selected(merged, path), path
+
+
+def test_merge_filters_leaf_selects_subtree():
+    merged = _merge_filters(
+        '<filter><a><b><c/></b></a></filter>', '<filter><a><b/><d/></a></filter>'
+    )
+    assert merged == "<filter><a><b/><d/></a></filter>"
+
+
+def test_merge_filters_rejects_content_match():
+    # <a><k>1</k></a> selects whole entries, merging it with <a><x/></a> would
+    # narrow them to k and x
+    with pytest.raises(ValueError):
+        _merge_filters("<filter><a><k>1</k></a></filter>", "<filter><a><x/></a></filter>")
+    with pytest.raises(ValueError):
+        _merge_filters("<filter><a><x/></a></filter>", "<filter><a><k>2</k></a></filter>")